@@ -1,35 +1,63 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+import heapq
+from typing import Dict, List, Optional, Tuple
 
 from .models import ScoredCandidate, DomainCheckResult
-from .utils.phonetics import vowel_consonant_balance
+from .utils.phonetics import vowel_consonant_balances
 
 
 def score_candidates(
-    names: List[str], research_results: Dict[str, List[Tuple[str, DomainCheckResult]]]
+    names: List[str],
+    research_results: Dict[str, List[Tuple[str, DomainCheckResult]]],
+    top_k: Optional[int] = None,
+    min_availability: float = 0.0,
 ) -> List[ScoredCandidate]:
-    out: List[ScoredCandidate] = []
-    for n in names:
-        availability_score = 0.0
-        domains = research_results.get(n, [])
-        if domains:
-            avail_count = sum(1 for _d, r in domains if getattr(r, "available", None))
-            availability_score = min(1.0, avail_count / max(1, len(domains)))
-        length_score = max(0.0, min(1.0, 12 / max(3, len(n))))
-        balance_score = vowel_consonant_balance(n)
-        final = 0.45 * length_score + 0.35 * balance_score + 0.20 * availability_score
-        out.append(
-            ScoredCandidate(
-                name=n,
-                score=round(final, 4),
-                details={
-                    "length": round(length_score, 4),
-                    "balance": round(balance_score, 4),
-                    "availability": round(availability_score, 4),
-                },
-                domains=[r for _d, r in domains],
+    """Score names and return them best-first; with `top_k`, only the best `top_k`.
+
+    Names whose availability score is below `min_availability` are dropped before
+    the remaining components are computed.
+    """
+    # Compute each score component as its own column, then combine them in one pass
+    domain_lists = [research_results.get(n, []) for n in names]
+    availability = [
+        (
+            min(
+                1.0,
+                sum(1 for _d, r in domains if getattr(r, "available", None)) / max(1, len(domains)),
             )
+            if domains
+            else 0.0
+        )
+        for domains in domain_lists
+    ]
+    if min_availability > 0.0:
+        keep = [i for i, av in enumerate(availability) if av >= min_availability]
+        names = [names[i] for i in keep]
+        domain_lists = [domain_lists[i] for i in keep]
+        availability = [availability[i] for i in keep]
+    length = [max(0.0, min(1.0, 12 / max(3, len(n)))) for n in names]
+    balance = vowel_consonant_balances(names)
+    scores = [
+        round(0.45 * ls + 0.35 * bs + 0.20 * av, 4)
+        for ls, bs, av in zip(length, balance, availability)
+    ]
+
+    # Rank indices once and only build the dataclasses that are returned
+    if top_k is not None:
+        order = heapq.nlargest(top_k, range(len(names)), key=scores.__getitem__)
+    else:
+        order = sorted(range(len(names)), key=scores.__getitem__, reverse=True)
+    return [
+        ScoredCandidate(
+            name=names[i],
+            score=scores[i],
+            details={
+                "length": round(length[i], 4),
+                "balance": round(balance[i], 4),
+                "availability": round(availability[i], 4),
+            },
+            domains=[r for _d, r in domain_lists[i]],
         )
-    out.sort(key=lambda c: c.score, reverse=True)
-    return out
+        for i in order
+    ]
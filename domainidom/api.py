@@ -1,11 +1,27 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, ORJSONResponse
 from .config import load_env
+from .utils.fastjson import ORJSON_AVAILABLE
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Load .env at startup rather than at import, so importing the app stays cheap
+    load_env()
+    yield
+
 
-load_env()
-app = FastAPI(title="domainidom")
+app = FastAPI(
+    title="domainidom",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
+)
 
 
 @app.get("/healthz")
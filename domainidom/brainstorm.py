@@ -1,38 +1,100 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import json
 import os
+import threading
 from typing import List
 import re
 
 import httpx
 
-DEFAULT_MAX = 50
+from .storage.cache import LLMCache
+from .utils import fastjson
+from .utils.http import HTTP2_AVAILABLE
 
+DEFAULT_MAX = 50
 
+_FENCE_RE = re.compile(r"^```[a-zA-Z]*\s*|```$")
+_LEAD_RE = re.compile(r"^[-*\d\.\)\]]+\s*")
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+# Whitespace plus the quote/comma debris LLMs leave around list items
+_STRIP_CHARS = " \t\r\n\x0b\x0c\u00a0\"',"
+_ARTIFACTS = frozenset("[]{}")
+_FALLBACK_NAMES: tuple[str, ...] = (
+    "Nexora",
+    "Brandora",
+    "Aivanta",
+    "Memora",
+    "Rhymio",
+    "Cleverly",
+    "Fluxio",
+    "Zenvia",
+    "Verveo",
+    "Briofy",
+    "Namewise",
+    "Lumico",
+    "Novara",
+    "Vocalo",
+    "Optimio",
+)
+
+
+# LLM settings are read lazily (after load_env) and cached for the process lifetime
+@functools.lru_cache(maxsize=1)
 def _get_llm_base_url() -> str | None:
     return (
         os.getenv("OPENAI_BASE_URL") or os.getenv("LMSTUDIO_BASE_URL") or "http://127.0.0.1:1234/v1"
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _get_llm_api_key() -> str | None:
     # For LM Studio local, most endpoints accept empty or dummy key
     return os.getenv("OPENAI_API_KEY", "lm-studio")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_llm_model() -> str:
+    return os.getenv("OPENAI_MODEL", "qwen3-coder-30b-a3b-instruct")
+
+
+def reset_env_cache() -> None:
+    """Forget cached LLM settings so changed environment variables are picked up."""
+    _get_llm_base_url.cache_clear()
+    _get_llm_api_key.cache_clear()
+    _get_llm_model.cache_clear()
+    _llm_cache.cache_clear()
+
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Return a process-wide client so repeated LLM calls reuse keep-alive connections."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(timeout=30, http2=HTTP2_AVAILABLE)
+                atexit.register(_client.close)
+    return _client
+
+
 def _clean_name(s: str) -> str:
-    s = s.strip()
-    s = re.sub(r"^```[a-zA-Z]*\s*|```$", "", s)
-    s = s.strip().strip("\"' ,")
-    s = re.sub(r"^[-*\d\.\)\]]+\s*", "", s)
-    s = s.strip()
+    s = _FENCE_RE.sub("", s.strip())
+    s = _LEAD_RE.sub("", s.strip(_STRIP_CHARS)).strip()
     # Drop list bracket artifacts
-    if s in {"[", "]", "[", "]", "{", "}"}:
+    if s in _ARTIFACTS:
         return ""
     return s
 
 
-def brainstorm_names(idea: str, max_candidates: int = DEFAULT_MAX) -> List[str]:
+def _chat_request(idea: str) -> tuple[str, dict[str, str], dict]:
+    """Build the (url, headers, payload) for an OpenAI-compatible chat completion."""
     prompt = (
         "Generate catchy, memorable brand names based on this idea. "
         "Prefer short, pronounceable, positive names. Reply with a JSON array of unique names only.\n\n"
@@ -42,53 +104,106 @@ def brainstorm_names(idea: str, max_candidates: int = DEFAULT_MAX) -> List[str]:
     # Try local LM Studio compatible API first
     base_url = _get_llm_base_url()
     api_key = _get_llm_api_key()
-    model = os.getenv("OPENAI_MODEL", "qwen3-coder-30b-a3b-instruct")
-
-    try:
-        resp = httpx.post(
-            f"{base_url}/chat/completions",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": "You are a naming assistant."},
-                    {"role": "user", "content": prompt},
-                ],
-                "temperature": 0.9,
-                "max_tokens": 800,
-            },
-            timeout=30,
-        )
-        resp.raise_for_status()
-        content = resp.json()["choices"][0]["message"]["content"].strip()
-    except Exception:
-        # Fallback: simple deterministic generation if no model server available
-        base = [
-            "Nexora",
-            "Brandora",
-            "Aivanta",
-            "Memora",
-            "Rhymio",
-            "Cleverly",
-            "Fluxio",
-            "Zenvia",
-            "Verveo",
-            "Briofy",
-            "Namewise",
-            "Lumico",
-            "Novara",
-            "Vocalo",
-            "Optimio",
-        ]
-        return base[:max_candidates]
-
-    # Attempt to parse as a JSON array; if not, split lines
-    names: List[str] = []
-    if content.startswith("["):
+    model = _get_llm_model()
+
+    return (
+        f"{base_url}/chat/completions",
+        {"Authorization": f"Bearer {api_key}"},
+        {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": "You are a naming assistant."},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.9,
+            "max_tokens": 800,
+        },
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_cache() -> LLMCache | None:
+    # Opt-in: responses are sampled at temperature 0.9, so reuse is a dev/retry convenience
+    if os.getenv("LLM_CACHE_ENABLED", "0") != "1":
+        return None
+    return LLMCache(os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3"))
+
+
+def _prompt_key(url: str, payload: dict) -> str:
+    # Bucket temperature so float noise (0.9 vs 0.90000001) still hits the same entry
+    keyed = {**payload, "url": url, "temperature": round(payload.get("temperature", 0.0), 1)}
+    return hashlib.sha256(json.dumps(keyed, sort_keys=True).encode()).hexdigest()
+
+
+def _completion_text(resp: httpx.Response) -> str:
+    # Parse the envelope from raw bytes with fastjson rather than httpx's stdlib-based .json()
+    return fastjson.loads(resp.content)["choices"][0]["message"]["content"].strip()
+
+
+def _fallback_names(max_candidates: int) -> List[str]:
+    # Simple deterministic generation if no model server available
+    return list(_FALLBACK_NAMES[:max_candidates])
+
+
+def brainstorm_names(idea: str, max_candidates: int = DEFAULT_MAX) -> List[str]:
+    if not idea.strip():
+        # Nothing to brainstorm from; don't spend an LLM round-trip on an empty prompt
+        return _fallback_names(max_candidates)
+    url, headers, payload = _chat_request(idea)
+    cache = _llm_cache()
+    key = _prompt_key(url, payload) if cache else ""
+    content = cache.get(key) if cache else None
+    if content is None:
+        try:
+            resp = _get_client().post(url, headers=headers, json=payload, timeout=30)
+            resp.raise_for_status()
+            content = _completion_text(resp)
+        except Exception:
+            return _fallback_names(max_candidates)
+        if cache:
+            cache.set(key, content)
+    return _parse_names(content, max_candidates)
+
+
+async def brainstorm_names_async(
+    idea: str,
+    max_candidates: int = DEFAULT_MAX,
+    client: httpx.AsyncClient | None = None,
+) -> List[str]:
+    """Async variant of `brainstorm_names`, for callers overlapping other I/O with the LLM call.
+
+    Pass `client` to reuse an existing connection pool; otherwise a short-lived one is opened.
+    """
+    if not idea.strip():
+        # Nothing to brainstorm from; don't spend an LLM round-trip on an empty prompt
+        return _fallback_names(max_candidates)
+    url, headers, payload = _chat_request(idea)
+    cache = _llm_cache()
+    key = _prompt_key(url, payload) if cache else ""
+    content = cache.get(key) if cache else None
+    if content is None:
         try:
-            import json
+            if client is not None:
+                resp = await client.post(url, headers=headers, json=payload, timeout=30)
+            else:
+                async with httpx.AsyncClient(timeout=30, http2=HTTP2_AVAILABLE) as own_client:
+                    resp = await own_client.post(url, headers=headers, json=payload)
+            resp.raise_for_status()
+            content = _completion_text(resp)
+        except Exception:
+            return _fallback_names(max_candidates)
+        if cache:
+            cache.set(key, content)
+    return _parse_names(content, max_candidates)
+
 
-            names = [str(x) for x in json.loads(content)]
+def _parse_names(content: str, max_candidates: int) -> List[str]:
+    # Attempt to parse the first JSON array (even inside a ```json fence); if not, split lines
+    names: List[str] = []
+    m = _JSON_ARRAY_RE.search(content)
+    if m:
+        try:
+            names = [_clean_name(str(x)) for x in fastjson.loads(m.group())]
         except Exception:
             pass
     if not names:
@@ -97,17 +212,11 @@ def brainstorm_names(idea: str, max_candidates: int = DEFAULT_MAX) -> List[str]:
             if line:
                 names.append(line)
 
-    # Deduplicate and cap
-    seen = set()
-    uniq = []
+    # Both branches yield cleaned names; deduplicate case-insensitively and cap
+    deduped: dict[str, str] = {}
     for n in names:
-        n = _clean_name(n)
-        if not n:
-            continue
-        low = n.lower()
-        if low not in seen:
-            seen.add(low)
-            uniq.append(n)
-        if len(uniq) >= max_candidates:
-            break
-    return uniq
+        if n and (key := n.lower()) not in deduped:
+            deduped[key] = n
+            if len(deduped) >= max_candidates:
+                break
+    return list(deduped.values())
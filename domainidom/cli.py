@@ -1,21 +1,48 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 import typer
 from .config import load_env
 
-from .brainstorm import brainstorm_names
-from .research import check_domains
-from .analyze import score_candidates
-from .package import write_reports
+# Command dependencies (httpx, asyncio, sqlite, ...) are imported inside the
+# commands that use them so `--help` and the light subcommands start quickly.
 
 app = typer.Typer(add_completion=False)
 
 
+def _domains_by_name(names: List[str], tlds: List[str]) -> Dict[str, List[str]]:
+    # Repeated --tld flags would otherwise check (and bill) the same domain twice
+    suffixes = ["." + t for t in dict.fromkeys(tlds)]
+    return {n: [n + s for s in suffixes] for n in names}
+
+
+def _use_uvloop() -> None:
+    # uvloop (optional, in the "fast" extra) then backs every event loop created afterwards,
+    # including the background loop check_domains runs its lookups on
+    try:
+        import uvloop
+    except ImportError:
+        return
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+async def _brainstorm_with_warmup(idea: str, max_candidates: int) -> List[str]:
+    import asyncio
+
+    from .brainstorm import brainstorm_names_async
+    from .services.domain_check import warm_dns
+
+    names, _ = await asyncio.gather(
+        brainstorm_names_async(idea=idea, max_candidates=max_candidates), warm_dns()
+    )
+    return names
+
+
 @app.command()
 def brainstorm(
     idea: str = typer.Option(..., help="Business idea overview"),
@@ -25,10 +52,13 @@ def brainstorm(
     max_candidates: int = typer.Option(50, help="Max number of names to generate"),
     out: Optional[Path] = typer.Option(None, help="Output JSON path (optional)"),
 ):
+    from .brainstorm import brainstorm_names
+    from .utils import fastjson
+
     names = brainstorm_names(idea=idea, max_candidates=max_candidates)
-    domains_by_name = {n: [f"{n}.{t}" for t in tlds] for n in names}
+    domains_by_name = _domains_by_name(names, tlds)
     if out:
-        out.write_text(json.dumps({"names": names, "domains": domains_by_name}, indent=2))
+        out.write_bytes(fastjson.dumps({"names": names, "domains": domains_by_name}, indent=True))
     typer.echo(f"Generated {len(names)} names")
 
 
@@ -42,12 +72,31 @@ def research(
     out: Optional[Path] = typer.Option(
         None, help="Output report path (JSON if endswith .json else CSV)"
     ),
+    top: Optional[int] = typer.Option(None, help="Only report the N best-scoring names"),
+    min_availability: float = typer.Option(
+        0.0, help="Drop names whose share of available domains is below this (0..1)"
+    ),
+    use_async: bool = typer.Option(
+        False, "--async", help="Resolve provider DNS while waiting on the LLM"
+    ),
 ):
+    from .analyze import score_candidates
+    from .package import write_reports
+    from .research import check_domains
+
+    _use_uvloop()
     idea = idea_file.read_text(encoding="utf-8").strip()
-    names = brainstorm_names(idea=idea, max_candidates=max)
-    domain_candidates = {n: [f"{n}.{t}" for t in tlds] for n in names}
+    if use_async:
+        import asyncio
+
+        names = asyncio.run(_brainstorm_with_warmup(idea, max))
+    else:
+        from .brainstorm import brainstorm_names
+
+        names = brainstorm_names(idea=idea, max_candidates=max)
+    domain_candidates = _domains_by_name(names, tlds)
     research_results = check_domains(domain_candidates)
-    scored = score_candidates(names, research_results)
+    scored = score_candidates(names, research_results, top_k=top, min_availability=min_availability)
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     if out is None:
         out = Path("reports") / f"report-{timestamp}.json"
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import os
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
 
 
 def load_env() -> None:
-    if not os.getenv("ENV_LOADED"):
-        load_dotenv(override=False)
-        os.environ["ENV_LOADED"] = "1"
+    """Apply `.env` to os.environ once per process, without overriding existing variables.
+
+    Later edits to `.env` need a restart: the credential and LLM getters cache what they
+    read. Set DOTENV_SKIP=1 to bypass the lookup entirely (e.g. in containers or tests).
+    """
+    if os.getenv("DOTENV_SKIP") or os.getenv("ENV_LOADED"):
+        return
+    path = find_dotenv()
+    if path:
+        load_dotenv(path, override=False)
+    os.environ["ENV_LOADED"] = "1"
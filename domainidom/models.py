@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class IdeaInput:
     idea: Optional[str] = None
     repo_path: Optional[str] = None
@@ -12,14 +12,14 @@ class IdeaInput:
     max_candidates: int = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class NameCandidate:
     name: str
     domains: List[str]
     meta: Dict[str, str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RegistrarPrice:
     """Price information from a specific registrar."""
 
@@ -33,7 +33,7 @@ class RegistrarPrice:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceComparison:
     """Comparison of prices across multiple registrars."""
 
@@ -44,14 +44,14 @@ class PriceComparison:
     def __post_init__(self):
         """Calculate the best price after initialization."""
         if not self.best_price and self.prices:
-            available_prices = [
-                p for p in self.prices if p.price_usd is not None and p.is_available
-            ]
-            if available_prices:
-                self.best_price = min(available_prices, key=lambda p: p.price_usd)
+            self.best_price = min(
+                (p for p in self.prices if p.price_usd is not None and p.is_available),
+                key=lambda p: p.price_usd,
+                default=None,
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainCheckResult:
     domain: str
     available: Optional[bool]
@@ -62,7 +62,7 @@ class DomainCheckResult:
     price_comparison: Optional[PriceComparison] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoredCandidate:
     name: str
     score: float
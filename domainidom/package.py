@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import csv
-import json
 from pathlib import Path
 from typing import List
 
 from .models import ScoredCandidate
+from .utils import fastjson
+
+# Rows buffered before each csv writerows() call
+_CSV_BATCH_ROWS = 1000
+# Registrars with their own price column, in header order
+_CSV_REGISTRARS = ("namecom", "godaddy", "cloudflare", "namecheap")
+# Domain/pricing columns for a candidate with no domains
+_NO_DOMAIN_COLUMNS = [None] * 10
 
 
 def write_reports(scored: List[ScoredCandidate], out: Path) -> None:
     out.parent.mkdir(parents=True, exist_ok=True)
     if out.suffix.lower() == ".csv":
-        with out.open("w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
+        with out.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            w = csv.writer(f, lineterminator="\n")
             # Enhanced header with price comparison data
             w.writerow(
                 [
@@ -33,17 +40,26 @@ def write_reports(scored: List[ScoredCandidate], out: Path) -> None:
                     "registration_urls",
                 ]
             )
+            rows: List[list] = []
             for c in scored:
+                if len(rows) >= _CSV_BATCH_ROWS:
+                    w.writerows(rows)
+                    rows.clear()
+                # Candidate-level columns shared by each of its domain rows
+                common = [
+                    c.name,
+                    c.score,
+                    c.details.get("length"),
+                    c.details.get("balance"),
+                    c.details.get("availability"),
+                ]
                 # Write a row per domain to include pricing
                 if c.domains:
                     for d in c.domains:
                         # Extract price comparison data
                         best_price = None
                         best_registrar = None
-                        namecom_price = None
-                        godaddy_price = None
-                        cloudflare_price = None
-                        namecheap_price = None
+                        registrar_prices = [None] * len(_CSV_REGISTRARS)
                         registration_urls = []
 
                         if d.price_comparison:
@@ -51,109 +67,80 @@ def write_reports(scored: List[ScoredCandidate], out: Path) -> None:
                                 best_price = d.price_comparison.best_price.price_usd
                                 best_registrar = d.price_comparison.best_price.registrar
 
-                            for price in d.price_comparison.prices:
-                                if price.registrar == "namecom":
-                                    namecom_price = price.price_usd
-                                elif price.registrar == "godaddy":
-                                    godaddy_price = price.price_usd
-                                elif price.registrar == "cloudflare":
-                                    cloudflare_price = price.price_usd
-                                elif price.registrar == "namecheap":
-                                    namecheap_price = price.price_usd
-
-                                if price.registration_url:
-                                    registration_urls.append(
-                                        f"{price.registrar}:{price.registration_url}"
-                                    )
-
-                        w.writerow(
-                            [
-                                c.name,
-                                c.score,
-                                c.details.get("length"),
-                                c.details.get("balance"),
-                                c.details.get("availability"),
-                                d.domain,
-                                d.registrar_price_usd,
-                                d.provider,
-                                best_price,
-                                best_registrar,
-                                namecom_price,
-                                godaddy_price,
-                                cloudflare_price,
-                                namecheap_price,
-                                "; ".join(registration_urls),
+                            by_registrar = {p.registrar: p for p in d.price_comparison.prices}
+                            registrar_prices = [
+                                getattr(by_registrar.get(r), "price_usd", None)
+                                for r in _CSV_REGISTRARS
+                            ]
+                            registration_urls = [
+                                f"{p.registrar}:{p.registration_url}"
+                                for p in d.price_comparison.prices
+                                if p.registration_url
                             ]
+
+                        rows.append(
+                            common
+                            + [d.domain, d.registrar_price_usd, d.provider]
+                            + [best_price, best_registrar]
+                            + registrar_prices
+                            + ["; ".join(registration_urls)]
                         )
                 else:
-                    w.writerow(
-                        [
-                            c.name,
-                            c.score,
-                            c.details.get("length"),
-                            c.details.get("balance"),
-                            c.details.get("availability"),
-                            None,
-                            None,
-                            None,
-                            None,
-                            None,
-                            None,
-                            None,
-                            None,
-                            None,
-                            None,
-                        ]
-                    )
+                    rows.append(common + _NO_DOMAIN_COLUMNS)
+            w.writerows(rows)
     else:
-        data = []
-        for c in scored:
-            domain_data = []
-            for d in c.domains:
-                domain_entry = {
-                    "domain": d.domain,
-                    "available": d.available,
-                    "provider": d.provider,
-                    "price_usd": d.registrar_price_usd,
-                    "error": d.error,
-                }
+        # Stream one candidate per line so only a single entry is materialized at a time
+        with out.open("wb", buffering=1 << 20) as f:
+            f.write(b'{"results": [')
+            for i, c in enumerate(scored):
+                f.write(b"\n" if i == 0 else b",\n")
+                f.write(fastjson.dumps(_candidate_entry(c)))
+            f.write(b"\n]}\n")
 
-                # Add price comparison data
-                if d.price_comparison:
-                    price_comparison_data = {"registrar_prices": [], "best_price": None}
-
-                    for price in d.price_comparison.prices:
-                        price_comparison_data["registrar_prices"].append(
-                            {
-                                "registrar": price.registrar,
-                                "price_usd": price.price_usd,
-                                "currency": price.currency,
-                                "is_available": price.is_available,
-                                "registration_url": price.registration_url,
-                                "renewal_price_usd": price.renewal_price_usd,
-                                "transfer_price_usd": price.transfer_price_usd,
-                                "error": price.error,
-                            }
-                        )
 
-                    if d.price_comparison.best_price:
-                        price_comparison_data["best_price"] = {
-                            "registrar": d.price_comparison.best_price.registrar,
-                            "price_usd": d.price_comparison.best_price.price_usd,
-                            "registration_url": d.price_comparison.best_price.registration_url,
-                        }
+def _candidate_entry(c: ScoredCandidate) -> dict:
+    domain_data = []
+    for d in c.domains:
+        domain_entry = {
+            "domain": d.domain,
+            "available": d.available,
+            "provider": d.provider,
+            "price_usd": d.registrar_price_usd,
+            "error": d.error,
+        }
 
-                    domain_entry["price_comparison"] = price_comparison_data
+        # Add price comparison data
+        if d.price_comparison:
+            price_comparison_data = {"registrar_prices": [], "best_price": None}
 
-                domain_data.append(domain_entry)
+            for price in d.price_comparison.prices:
+                price_comparison_data["registrar_prices"].append(
+                    {
+                        "registrar": price.registrar,
+                        "price_usd": price.price_usd,
+                        "currency": price.currency,
+                        "is_available": price.is_available,
+                        "registration_url": price.registration_url,
+                        "renewal_price_usd": price.renewal_price_usd,
+                        "transfer_price_usd": price.transfer_price_usd,
+                        "error": price.error,
+                    }
+                )
 
-            data.append(
-                {
-                    "name": c.name,
-                    "score": c.score,
-                    "details": c.details,
-                    "domains": domain_data,
+            if d.price_comparison.best_price:
+                price_comparison_data["best_price"] = {
+                    "registrar": d.price_comparison.best_price.registrar,
+                    "price_usd": d.price_comparison.best_price.price_usd,
+                    "registration_url": d.price_comparison.best_price.registration_url,
                 }
-            )
 
-        out.write_text(json.dumps({"results": data}, indent=2), encoding="utf-8")
+            domain_entry["price_comparison"] = price_comparison_data
+
+        domain_data.append(domain_entry)
+
+    return {
+        "name": c.name,
+        "score": c.score,
+        "details": c.details,
+        "domains": domain_data,
+    }
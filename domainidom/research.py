@@ -1,29 +1,44 @@
 from __future__ import annotations
 
+import functools
 from typing import Dict, List
 import re
 
 from .services.domain_check import check_domains as service_check_domains
 
+_BACKTICKS_RE = re.compile(r"^`+|`+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_LABEL_RE = re.compile(r"[^a-z0-9-]")
+_HYPHEN_RUN_RE = re.compile(r"-+")
 
+
+# Pure name -> label mapping; memoized since the same names recur across runs and TLD sets
+@functools.lru_cache(maxsize=4096)
 def _to_label(name: str) -> str:
     s = name.strip().lower()
-    s = re.sub(r"^`+|`+$", "", s)
+    s = _BACKTICKS_RE.sub("", s)
     s = s.strip("\"' ,")  # strip quotes/commas if present
-    s = re.sub(r"\s+", "-", s)
-    s = re.sub(r"[^a-z0-9-]", "", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    s = _WHITESPACE_RE.sub("-", s)
+    s = _NON_LABEL_RE.sub("", s)
+    s = _HYPHEN_RUN_RE.sub("-", s).strip("-")
     return s
 
 
 def check_domains_for_names(names: List[str], tlds: List[str]) -> Dict[str, List[str]]:
     out: Dict[str, List[str]] = {}
+    tlds = list(dict.fromkeys(tlds))
+    # Names that normalize to the same label (e.g. "Foo Bar" and "foo-bar") reuse the built
+    # domain strings, but each name gets its own list so callers can edit one safely
+    by_label: Dict[str, List[str]] = {}
     for n in names:
         label = _to_label(n)
         if not label:
             out[n] = []
             continue
-        out[n] = [f"{label}.{t}" for t in tlds]
+        domains = by_label.get(label)
+        if domains is None:
+            domains = by_label[label] = [f"{label}.{t}" for t in tlds]
+        out[n] = list(domains)
     return out
 
 
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import os
+import threading
 import time
+import weakref
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Awaitable, Dict, List, Tuple
+from urllib.parse import urlsplit
 
 # Import httpx only when available
 try:
@@ -15,8 +20,19 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 from ..storage.cache import DomainCache
-from ..models import DomainCheckResult, PriceComparison
-from .pricing import get_multi_registrar_pricing
+from ..models import DomainCheckResult, PriceComparison, RegistrarPrice
+from ..utils import fastjson
+from ..utils.http import HTTP2_AVAILABLE, client_scope
+from . import pricing
+from .pricing import (
+    _JSON_HEADERS,
+    NAMECOM_BATCH_SIZE,
+    _get_namecom_credentials,
+    _namecom_auth,
+    get_multi_registrar_pricing,
+    get_multi_registrar_pricing_batch,
+    match_namecom_results,
+)
 
 RATE_LIMIT_RPS = float(os.getenv("DOMAIN_CHECK_RPS", "3"))
 BURST = int(os.getenv("DOMAIN_CHECK_BURST", "5"))
@@ -24,11 +40,26 @@ RETRY_BACKOFF = [0.5, 1.0, 2.0]
 CACHE_PATH = os.getenv("DOMAIN_CACHE_PATH", "domain_cache.sqlite3")
 
 DOMAINR_BASE = "https://api.domainr.com/v2/status"
+# Domainr status is a space-separated list of tokens; any of these means registrable
+_DOMAINR_AVAILABLE_STATUSES = frozenset({"inactive", "undelegated", "available"})
 
 # MCP FastDomainCheck configuration
 MCP_BATCH_SIZE = int(os.getenv("MCP_BATCH_SIZE", "20"))
 
 
+# Provider keys are read lazily (after load_env) and cached like the registrar credentials
+# in pricing; call reset_env_cache() after changing the environment
+@functools.lru_cache(maxsize=1)
+def _get_domainr_key() -> str | None:
+    return os.getenv("DOMAINR_API_KEY")
+
+
+def reset_env_cache() -> None:
+    """Forget cached provider keys (and pricing's credentials) so environment changes apply."""
+    _get_domainr_key.cache_clear()
+    pricing.reset_env_cache()
+
+
 # Enable multi-registrar pricing comparison (read dynamically for tests)
 def is_multi_registrar_enabled() -> bool:
     return os.getenv("ENABLE_MULTI_REGISTRAR", "1") == "1"
@@ -39,7 +70,7 @@ def is_mcp_fastdomaincheck_enabled() -> bool:
     return os.getenv("MCP_FASTDOMAINCHECK_ENABLED", "0") == "1"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResponse:
     available: bool | None
     price_usd: float | None
@@ -54,23 +85,30 @@ class TokenBucket:
         self.capacity = burst
         self.tokens = burst
         self.timestamp = time.monotonic()
-
-    async def acquire(self) -> None:
-        while True:
+        # The bucket is shared by check_domains' background loop and by callers running
+        # acheck_domains on their own loops (other threads), so its state is guarded by a
+        # thread lock that is only held while reserving a token, never across a sleep
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, going into debt if none is left; return how long to wait for it."""
+        with self._lock:
             now = time.monotonic()
-            elapsed = now - self.timestamp
+            self.tokens = min(self.capacity, self.tokens + (now - self.timestamp) * self.rps)
             self.timestamp = now
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rps)
-            if self.tokens >= 1:
-                self.tokens -= 1
-                return
-            await asyncio.sleep(max(0.05, (1 - self.tokens) / self.rps))
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rps
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
 
 
 bucket = TokenBucket(RATE_LIMIT_RPS, BURST)
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPBatchRequest:
     """MCP FastDomainCheck batch request format."""
 
@@ -78,7 +116,7 @@ class MCPBatchRequest:
     include_pricing: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPDomainResult:
     """MCP FastDomainCheck domain result format."""
 
@@ -88,7 +126,7 @@ class MCPDomainResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPBatchResponse:
     """MCP FastDomainCheck batch response format."""
 
@@ -106,7 +144,9 @@ class MCPFastDomainCheckClient:
         self.api_key = os.getenv("MCP_FASTDOMAINCHECK_API_KEY")
         self.timeout = float(os.getenv("MCP_FASTDOMAINCHECK_TIMEOUT", "30"))
 
-    async def check_domains_batch(self, domains: List[str]) -> MCPBatchResponse:
+    async def check_domains_batch(
+        self, domains: List[str], client: httpx.AsyncClient | None = None
+    ) -> MCPBatchResponse:
         """Check domain availability in batch via MCP FastDomainCheck."""
         if not HTTPX_AVAILABLE:
             # Return stub response when httpx not available
@@ -132,21 +172,24 @@ class MCPFastDomainCheckClient:
                 if backoff:
                     await asyncio.sleep(backoff)
 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                async with client_scope(client, timeout=self.timeout) as client:
                     await bucket.acquire()
                     response = await client.post(
                         self.endpoint,
-                        json={
-                            "domains": request_data.domains,
-                            "include_pricing": request_data.include_pricing,
-                        },
+                        content=fastjson.dumps(
+                            {
+                                "domains": request_data.domains,
+                                "include_pricing": request_data.include_pricing,
+                            }
+                        ),
                         headers={
                             "Authorization": f"Bearer {self.api_key}",
                             "Content-Type": "application/json",
                         },
+                        timeout=self.timeout,
                     )
                     response.raise_for_status()
-                    data = response.json()
+                    data = fastjson.loads(response.content)
 
                     # Parse MCP response format
                     results = []
@@ -179,14 +222,18 @@ class MCPFastDomainCheckClient:
         )
 
 
-async def _fetch_mcp_fastdomaincheck(domains: List[str]) -> List[ProviderResponse]:
+async def _fetch_mcp_fastdomaincheck(
+    domains: List[str],
+    client: httpx.AsyncClient | None = None,
+    mcp_client: MCPFastDomainCheckClient | None = None,
+) -> List[ProviderResponse]:
     """Fetch domain availability via MCP FastDomainCheck in batch."""
     if not is_mcp_fastdomaincheck_enabled():
         return [ProviderResponse(None, None, "stub", "mcp_disabled") for _ in domains]
 
     try:
-        client = MCPFastDomainCheckClient()
-        batch_response = await client.check_domains_batch(domains)
+        mcp_client = mcp_client or MCPFastDomainCheckClient()
+        batch_response = await mcp_client.check_domains_batch(domains, client=client)
 
         responses = []
         for result in batch_response.results:
@@ -212,45 +259,66 @@ async def _fetch_mcp_fastdomaincheck(domains: List[str]) -> List[ProviderRespons
         ]
 
 
-async def _fetch_namecom(domain: str) -> ProviderResponse:
+async def _fetch_namecom(domain: str, client: httpx.AsyncClient | None = None) -> ProviderResponse:
+    return (await _fetch_namecom_batch([domain], client=client))[domain]
+
+
+async def _fetch_namecom_batch(
+    domains: List[str], client: httpx.AsyncClient | None = None
+) -> Dict[str, ProviderResponse]:
+    """Check many domains with Name.com, NAMECOM_BATCH_SIZE per checkAvailability call."""
     if not HTTPX_AVAILABLE:
-        return ProviderResponse(None, None, "stub", "httpx_not_available")
+        return {d: ProviderResponse(None, None, "stub", "httpx_not_available") for d in domains}
 
-    NAMECOM_API_USERNAME = os.getenv("NAME_COM_USERNAME") or os.getenv("name_com_DEV_USERNAME")
-    NAMECOM_API_TOKEN = os.getenv("NAME_COM_API_KEY") or os.getenv("name_com_DEV_API_KEY")
+    NAMECOM_API_USERNAME, NAMECOM_API_TOKEN = _get_namecom_credentials()
     NAMECOM_BASE = os.getenv("NAME_COM_BASE", "https://api.dev.name.com/v4")
     if not (NAMECOM_API_USERNAME and NAMECOM_API_TOKEN):
-        return ProviderResponse(None, None, "stub", "missing_namecom_keys")
+        return {d: ProviderResponse(None, None, "stub", "missing_namecom_keys") for d in domains}
     url = f"{NAMECOM_BASE}/domains:checkAvailability"
-    payload = {"domainNames": [domain]}
-    for backoff in [0] + RETRY_BACKOFF:
-        try:
-            if backoff:
-                await asyncio.sleep(backoff)
-            async with httpx.AsyncClient(timeout=10) as client:
-                await bucket.acquire()
-                resp = await client.post(
-                    url, json=payload, auth=(NAMECOM_API_USERNAME, NAMECOM_API_TOKEN)
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                # Name.com returns array of check results; use first
-                item = data.get("results", [{}])[0]
-                available = bool(item.get("purchasable", False))
-                price = None
-                if "purchasePrice" in item and isinstance(item["purchasePrice"], dict):
-                    price = float(item["purchasePrice"].get("amount", 0))
-                return ProviderResponse(available, price, "name.com")
-        except Exception:
-            continue
-    return ProviderResponse(None, None, "name.com", "request_failed")
+    auth = _namecom_auth(NAMECOM_API_USERNAME, NAMECOM_API_TOKEN)
+    out: Dict[str, ProviderResponse] = {}
+    for i in range(0, len(domains), NAMECOM_BATCH_SIZE):
+        chunk = domains[i : i + NAMECOM_BATCH_SIZE]
+        payload = {"domainNames": chunk}
+        for backoff in [0] + RETRY_BACKOFF:
+            try:
+                if backoff:
+                    await asyncio.sleep(backoff)
+                async with client_scope(client, timeout=10) as http:
+                    await bucket.acquire()
+                    resp = await http.post(
+                        url, content=fastjson.dumps(payload), headers=_JSON_HEADERS, auth=auth
+                    )
+                    resp.raise_for_status()
+                    items = fastjson.loads(resp.content).get("results", [])
+                for domain, item in zip(chunk, match_namecom_results(chunk, items)):
+                    out[domain] = (
+                        _namecom_response(item)
+                        if item is not None
+                        else ProviderResponse(None, None, "name.com", "missing_result")
+                    )
+                break
+            except Exception:
+                continue
+        else:
+            for domain in chunk:
+                out[domain] = ProviderResponse(None, None, "name.com", "request_failed")
+    return out
+
 
+def _namecom_response(item: dict) -> ProviderResponse:
+    available = bool(item.get("purchasable", False))
+    price = None
+    if "purchasePrice" in item and isinstance(item["purchasePrice"], dict):
+        price = float(item["purchasePrice"].get("amount", 0))
+    return ProviderResponse(available, price, "name.com")
 
-async def _fetch_domainr(domain: str) -> ProviderResponse:
+
+async def _fetch_domainr(domain: str, client: httpx.AsyncClient | None = None) -> ProviderResponse:
     if not HTTPX_AVAILABLE:
         return ProviderResponse(None, None, "stub", "httpx_not_available")
 
-    DOMAINR_API_KEY = os.getenv("DOMAINR_API_KEY")
+    DOMAINR_API_KEY = _get_domainr_key()
     if not DOMAINR_API_KEY:
         return ProviderResponse(None, None, "stub", "missing_domainr_key")
     params = {"domain": domain, "key": DOMAINR_API_KEY}
@@ -258,15 +326,15 @@ async def _fetch_domainr(domain: str) -> ProviderResponse:
         try:
             if backoff:
                 await asyncio.sleep(backoff)
-            async with httpx.AsyncClient(timeout=10) as client:
+            async with client_scope(client, timeout=10) as client:
                 await bucket.acquire()
                 resp = await client.get(DOMAINR_BASE, params=params)
                 resp.raise_for_status()
-                statuses = resp.json().get("status", [])
+                statuses = fastjson.loads(resp.content).get("status", [])
                 available = None
                 if statuses:
                     s = statuses[0].get("status", "")
-                    available = "inactive" in s or "undelegated" in s or "available" in s
+                    available = not _DOMAINR_AVAILABLE_STATUSES.isdisjoint(s.split())
                 return ProviderResponse(available, None, "domainr")
         except Exception:
             continue
@@ -282,33 +350,24 @@ async def _fetch_whoisxml(domain: str) -> ProviderResponse:
     return ProviderResponse(None, None, "whoisxml", "not_implemented")
 
 
-async def _fetch_best(domain: str) -> ProviderResponse:
-    """Fetch domain info with optional multi-registrar pricing comparison."""
+async def _fetch_best(
+    domain: str,
+    client: httpx.AsyncClient | None = None,
+    namecom: ProviderResponse | None = None,
+    price_comparison: PriceComparison | None = None,
+) -> ProviderResponse:
+    """Fetch domain info with optional multi-registrar pricing comparison.
+
+    `namecom` is a Name.com result already fetched in a batch; when given, it is used
+    instead of a per-domain Name.com request. Likewise `price_comparison` replaces the
+    per-domain multi-registrar pricing call.
+    """
     # If multi-registrar pricing is enabled, get comprehensive pricing data
     if is_multi_registrar_enabled():
         try:
-            price_comparison = await get_multi_registrar_pricing(domain)
-
-            # Determine availability from any registrar that provided data
-            available = None
-            best_price = None
-            primary_provider = "multi-registrar"
-
-            for price in price_comparison.prices:
-                if price.is_available is not None:
-                    available = price.is_available
-                    primary_provider = price.registrar
-                    break
-
-            if price_comparison.best_price:
-                best_price = price_comparison.best_price.price_usd
-
-            return ProviderResponse(
-                available=available,
-                price_usd=best_price,
-                provider=primary_provider,
-                price_comparison=price_comparison,
-            )
+            if price_comparison is None:
+                price_comparison = await get_multi_registrar_pricing(domain, client=client)
+            return _from_price_comparison(price_comparison)
         except Exception:
             # Fall back to legacy behavior on error
             pass
@@ -316,123 +375,406 @@ async def _fetch_best(domain: str) -> ProviderResponse:
     # Prioritize MCP FastDomainCheck (if enabled), then Name.com (dev), then Domainr; others stubbed
     if is_mcp_fastdomaincheck_enabled():
         # For single domain, use batch endpoint with single domain
-        mcp_responses = await _fetch_mcp_fastdomaincheck([domain])
+        mcp_responses = await _fetch_mcp_fastdomaincheck([domain], client=client)
         if mcp_responses and mcp_responses[0].available is not None:
             return mcp_responses[0]
 
-    res = await _fetch_namecom(domain)
-    if res.available is not None:
-        return res
-    res = await _fetch_domainr(domain)
-    if res.available is not None:
-        return res
-    return ProviderResponse(None, None, "stub", "no_provider")
+    if namecom is not None and namecom.available is not None:
+        return namecom
+    # Without a batched Name.com answer, ask Name.com and Domainr concurrently so a slow
+    # or rate-limited provider does not hold up the other
+    lookups = [_fetch_domainr(domain, client=client)]
+    if namecom is None:
+        lookups.insert(0, _fetch_namecom(domain, client=client))
+    res = await _first_available(lookups)
+    return res or ProviderResponse(None, None, "stub", "no_provider")
+
+
+def _from_price_comparison(price_comparison: PriceComparison) -> ProviderResponse:
+    # Determine availability from any registrar that provided data
+    available = None
+    best_price = None
+    primary_provider = "multi-registrar"
+
+    for price in price_comparison.prices:
+        if price.is_available is not None:
+            available = price.is_available
+            primary_provider = price.registrar
+            break
+
+    if price_comparison.best_price:
+        best_price = price_comparison.best_price.price_usd
+
+    return ProviderResponse(
+        available=available,
+        price_usd=best_price,
+        provider=primary_provider,
+        price_comparison=price_comparison,
+    )
+
+
+async def _first_available(lookups: List[Awaitable[ProviderResponse]]) -> ProviderResponse | None:
+    """Run provider lookups concurrently and return the first definitive answer.
+
+    Lookups earlier in the list win when several finish together; the rest are cancelled.
+    """
+    tasks = [asyncio.ensure_future(lookup) for lookup in lookups]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task in done and task.exception() is None:
+                    res = task.result()
+                    if res.available is not None:
+                        return res
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _to_result(domain: str, resp: ProviderResponse) -> DomainCheckResult:
+    return DomainCheckResult(
+        domain=domain,
+        available=resp.available,
+        registrar_price_usd=resp.price_usd,
+        provider=resp.provider,
+        error=resp.error,
+        price_comparison=resp.price_comparison,
+    )
+
+
+def _cache_entry(
+    dcr: DomainCheckResult,
+) -> Tuple[bool | None, float | None, str | None, str | None]:
+    return (dcr.available, dcr.registrar_price_usd, dcr.provider, dcr.error)
+
+
+def _price_entry(p: RegistrarPrice) -> tuple:
+    return (
+        p.registrar,
+        p.price_usd,
+        p.currency,
+        p.is_available,
+        p.registration_url,
+        p.renewal_price_usd,
+        p.transfer_price_usd,
+        p.error,
+    )
+
+
+def _provider_hosts() -> List[str]:
+    """Hostnames the next `check_domains` run will call, given the current settings."""
+    urls = [DOMAINR_BASE]
+    if is_multi_registrar_enabled():
+        urls += [
+            pricing.REGISTRAR_API_BASES[name]
+            for name, _, _ in pricing._enabled_registrars()
+            if name in pricing.REGISTRAR_API_BASES
+        ]
+    # Name.com also backs the legacy chain and the fallback when pricing fails
+    urls.append(os.getenv("NAME_COM_BASE", "https://api.dev.name.com/v4"))
+    if is_mcp_fastdomaincheck_enabled():
+        urls.append(
+            os.getenv("MCP_FASTDOMAINCHECK_ENDPOINT", "http://localhost:8080/v1/domains/check")
+        )
+    return list(dict.fromkeys(h for h in (urlsplit(u).hostname for u in urls) if h))
 
 
-def check_domains(
+async def warm_dns() -> None:
+    """Resolve provider hostnames ahead of `check_domains`.
+
+    getaddrinfo keeps no cache of its own, so this only saves time when the OS runs a
+    caching resolver (systemd-resolved, nscd, dnsmasq, ...). Failures are ignored.
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.getaddrinfo(host, 443) for host in _provider_hosts()), return_exceptions=True
+    )
+
+
+async def _check_mcp_batches(
+    domains: List[str],
+    checked: Dict[str, DomainCheckResult],
+    client: httpx.AsyncClient | None,
+) -> None:
+    """Check `domains` through MCP FastDomainCheck in MCP_BATCH_SIZE batches."""
+    try:
+        # Read the MCP endpoint settings once per run rather than once per batch
+        mcp_client = MCPFastDomainCheckClient()
+        for i in range(0, len(domains), MCP_BATCH_SIZE):
+            batch = domains[i : i + MCP_BATCH_SIZE]
+            batch_responses = await _fetch_mcp_fastdomaincheck(
+                batch, client=client, mcp_client=mcp_client
+            )
+
+            # Map responses back to their domains
+            for domain, resp in zip(batch, batch_responses):
+                checked[domain] = _to_result(domain, resp)
+
+    except Exception as e:
+        # Fallback to individual processing if batch fails
+        for domain in domains:
+            resp = ProviderResponse(
+                None, None, "mcp-fastdomaincheck", f"batch_fallback_error: {str(e)}"
+            )
+            checked[domain] = _to_result(domain, resp)
+
+
+# Lookups in flight per event loop, keyed by domain: concurrent check_domains calls share
+# the background loop, so overlapping domains can wait on one lookup instead of repeating it
+_pending: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _check_each(
+    domains: List[str],
+    checked: Dict[str, DomainCheckResult],
+    client: httpx.AsyncClient | None,
+    concurrency: int,
+) -> None:
+    """Check `domains` via `_fetch_best`, joining lookups another run already has in flight."""
+    loop = asyncio.get_running_loop()
+    pending: Dict[str, asyncio.Future] = _pending.setdefault(loop, {})
+    joined = {d: pending[d] for d in domains if d in pending}
+    own = {d: loop.create_future() for d in domains if d not in joined}
+    pending.update(own)
+    try:
+        if own:
+            await _fetch_each(list(own), checked, client, concurrency)
+    finally:
+        for d, fut in own.items():
+            # None tells joined runs this lookup was abandoned (e.g. the run was cancelled)
+            fut.set_result(checked.get(d))
+            if pending.get(d) is fut:
+                del pending[d]
+    retry = []
+    for d, fut in joined.items():
+        # Shielded: cancelling this run must not cancel the owner's result for others
+        dcr = await asyncio.shield(fut)
+        if dcr is None:
+            retry.append(d)
+        else:
+            checked[d] = dcr
+    if retry:
+        # The owner gave up, so look these up here rather than report its failure
+        await _check_each(retry, checked, client, concurrency)
+
+
+async def _fetch_each(
+    domains: List[str],
+    checked: Dict[str, DomainCheckResult],
+    client: httpx.AsyncClient | None,
+    concurrency: int,
+) -> None:
+    """Check `domains` one by one via `_fetch_best`, with at most `concurrency` in flight."""
+    sem = asyncio.Semaphore(concurrency)
+    namecom: Dict[str, ProviderResponse] = {}
+    comparisons: Dict[str, PriceComparison] = {}
+    if not is_multi_registrar_enabled():
+        # Name.com is first in the legacy chain and accepts many domains per request
+        namecom = await _fetch_namecom_batch(domains, client=client)
+    elif len(domains) > 1:
+        # Price the whole set with one bulk request per registrar; a failed batch leaves
+        # each domain to the per-domain path
+        try:
+            comparisons = await get_multi_registrar_pricing_batch(domains, client=client)
+        except Exception:
+            comparisons = {}
+
+    async def _fetch_guarded(domain: str) -> Tuple[str, ProviderResponse]:
+        async with sem:
+            try:
+                resp = await _fetch_best(
+                    domain,
+                    client=client,
+                    namecom=namecom.get(domain),
+                    price_comparison=comparisons.get(domain),
+                )
+                return domain, resp
+            except Exception as e:
+                return domain, ProviderResponse(None, None, "error", str(e))
+
+    if concurrency == 1 or len(domains) == 1:
+        # Nothing would overlap anyway: await in turn instead of wrapping each in a Task
+        for domain in domains:
+            domain, resp = await _fetch_guarded(domain)
+            checked[domain] = _to_result(domain, resp)
+        return
+    # Results are only used once all have arrived (cache writes are batched), so gather
+    # them in one go rather than waking up per completion
+    for domain, resp in await asyncio.gather(*(_fetch_guarded(d) for d in domains)):
+        checked[domain] = _to_result(domain, resp)
+
+
+def _open_cache() -> DomainCache:
+    return DomainCache(
+        os.getenv("DOMAIN_CACHE_PATH", "domain_cache.sqlite3"),
+        error_ttl_seconds=float(os.getenv("DOMAIN_CACHE_ERROR_TTL", "300")),
+        synchronous=os.getenv("DOMAIN_CACHE_DURABILITY", "NORMAL"),
+        price_ttl_seconds=float(os.getenv("DOMAIN_CACHE_PRICE_TTL", "86400")),
+    )
+
+
+def _cached_results(
+    cache: DomainCache, domain_candidates: Dict[str, List[str]]
+) -> Dict[str, DomainCheckResult]:
+    """Cached results for every candidate domain, built once per unique domain.
+
+    With multi-registrar pricing on, results get back their stored price comparison; a
+    domain whose quotes are past the price TTL counts as a miss, so it is re-priced.
+    """
+    rows = cache.get_many(d for domains in domain_candidates.values() for d in domains)
+    quotes = cache.get_prices_many(rows) if rows and is_multi_registrar_enabled() else {}
+    results = {}
+    for d, row in rows.items():
+        comparison = None
+        if d in quotes:
+            if quotes[d] is None:
+                continue
+            comparison = PriceComparison(d, [RegistrarPrice(*q) for q in quotes[d]])
+        results[d] = DomainCheckResult(d, *row, price_comparison=comparison)
+    return results
+
+
+def _all_cached(
+    cache: DomainCache, domain_candidates: Dict[str, List[str]]
+) -> Dict[str, List[Tuple[str, DomainCheckResult]]] | None:
+    """Results served entirely from the cache, or None if any domain needs a lookup."""
+    cached = _cached_results(cache, domain_candidates)
+    results: Dict[str, List[Tuple[str, DomainCheckResult]]] = {}
+    for name, domains in domain_candidates.items():
+        entries = results[name] = []
+        for d in domains:
+            dcr = cached.get(d)
+            if dcr is None:
+                return None
+            entries.append((d, dcr))
+    return results
+
+
+async def acheck_domains(
     domain_candidates: Dict[str, List[str]],
 ) -> Dict[str, List[Tuple[str, DomainCheckResult]]]:
-    cache_path = os.getenv("DOMAIN_CACHE_PATH", "domain_cache.sqlite3")
-    cache = DomainCache(cache_path)
+    """Async form of `check_domains` for callers already running an event loop."""
+    cache = _open_cache()
+    try:
+        return await _acheck_with_cache(cache, domain_candidates)
+    finally:
+        cache.close()
+
+
+async def _acheck_with_cache(
+    cache: DomainCache, domain_candidates: Dict[str, List[str]]
+) -> Dict[str, List[Tuple[str, DomainCheckResult]]]:
     max_calls_total = int(os.getenv("DOMAIN_CHECK_MAX_CALLS", "80"))
     calls_made = 0
-
-    async def _run() -> Dict[str, List[Tuple[str, DomainCheckResult]]]:
-        nonlocal calls_made
-        results: Dict[str, List[Tuple[str, DomainCheckResult]]] = {}
-
-        # Track domains that need checking (not in cache)
-        domains_to_check: List[Tuple[str, str]] = []  # (name, domain) pairs
-
-        # First pass: handle cached domains and collect uncached ones
-        for name, domains in domain_candidates.items():
-            results[name] = []
-            for d in domains:
-                cached = cache.get(d)
-                if cached is not None:
-                    available, price, provider, error = cached
-                    results[name].append(
-                        (d, DomainCheckResult(d, available, price, provider, error))
-                    )
-                    continue
-                if calls_made >= max_calls_total:
-                    results[name].append(
-                        (d, DomainCheckResult(d, None, None, "quota", "max_calls_reached"))
-                    )
-                    continue
+    results: Dict[str, List[Tuple[str, DomainCheckResult]]] = {}
+
+    # Track domains that need checking (not in cache)
+    domains_to_check: List[Tuple[str, str]] = []  # (name, domain) pairs
+    # Unique uncached domains: a domain shared by several names is fetched once
+    unique_domains: Dict[str, None] = {}
+
+    # First pass: handle cached domains (one bulk lookup) and collect uncached ones
+    cached = _cached_results(cache, domain_candidates)
+    for name, domains in domain_candidates.items():
+        results[name] = []
+        for d in domains:
+            dcr = cached.get(d)
+            if dcr is not None:
+                results[name].append((d, dcr))
+                continue
+            if d in unique_domains:
                 domains_to_check.append((name, d))
-                calls_made += 1
+                continue
+            if calls_made >= max_calls_total:
+                results[name].append(
+                    (d, DomainCheckResult(d, None, None, "quota", "max_calls_reached"))
+                )
+                continue
+            domains_to_check.append((name, d))
+            unique_domains[d] = None
+            calls_made += 1
+
+    checked: Dict[str, DomainCheckResult] = {}
+
+    if unique_domains:
+        concurrency = max(1, int(os.getenv("DOMAIN_CHECK_CONCURRENCY", "16")))
+        # One pooled client for every provider call in this run, so connections
+        # (and TLS sessions) are reused instead of re-established per request
+        async with contextlib.AsyncExitStack() as stack:
+            client = None
+            if HTTPX_AVAILABLE:
+                client = await stack.enter_async_context(
+                    httpx.AsyncClient(
+                        timeout=10,
+                        http2=HTTP2_AVAILABLE,
+                        limits=httpx.Limits(
+                            max_connections=concurrency * 2,
+                            max_keepalive_connections=concurrency,
+                        ),
+                    )
+                )
+            if is_mcp_fastdomaincheck_enabled():
+                await _check_mcp_batches(list(unique_domains), checked, client)
+            else:
+                await _check_each(list(unique_domains), checked, client, concurrency)
+
+    # Fan each result out to every name that asked for it, in submission order
+    for name, domain in domains_to_check:
+        dcr = checked.get(domain)
+        if dcr is not None:
+            results.setdefault(name, []).append((domain, dcr))
+
+    # Fresh results and their registrar quotes, written back to the cache in one transaction
+    if checked:
+        with cache.bulk():
+            cache.set_many((domain, _cache_entry(dcr)) for domain, dcr in checked.items())
+            # A result without a comparison clears the domain's old quotes, so they do not
+            # expire later and send an unpriced result back for re-pricing on every run
+            cache.set_prices_many(
+                (
+                    domain,
+                    (
+                        [_price_entry(p) for p in dcr.price_comparison.prices]
+                        if dcr.price_comparison is not None
+                        else []
+                    ),
+                )
+                for domain, dcr in checked.items()
+            )
+    return results
 
-        # If MCP is enabled and we have domains to check, use batch processing
-        if is_mcp_fastdomaincheck_enabled() and domains_to_check:
-            # Extract just the domain names for batch processing
-            batch_domains = [domain for _, domain in domains_to_check]
 
-            try:
-                # Process in batches
-                batch_size = MCP_BATCH_SIZE
-                for i in range(0, len(batch_domains), batch_size):
-                    batch = batch_domains[i : i + batch_size]
-                    batch_responses = await _fetch_mcp_fastdomaincheck(batch)
-
-                    # Map responses back to results
-                    for j, resp in enumerate(batch_responses):
-                        if i + j < len(domains_to_check):
-                            name, domain = domains_to_check[i + j]
-                            dcr = DomainCheckResult(
-                                domain=domain,
-                                available=resp.available,
-                                registrar_price_usd=resp.price_usd,
-                                provider=resp.provider,
-                                error=resp.error,
-                                price_comparison=resp.price_comparison,
-                            )
-                            results.setdefault(name, []).append((domain, dcr))
-                            cache.set(
-                                domain,
-                                (dcr.available, dcr.registrar_price_usd, dcr.provider, dcr.error),
-                            )
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
 
-            except Exception as e:
-                # Fallback to individual processing if batch fails
-                for name, domain in domains_to_check:
-                    resp = ProviderResponse(
-                        None, None, "mcp-fastdomaincheck", f"batch_fallback_error: {str(e)}"
-                    )
-                    dcr = DomainCheckResult(
-                        domain=domain,
-                        available=resp.available,
-                        registrar_price_usd=resp.price_usd,
-                        provider=resp.provider,
-                        error=resp.error,
-                        price_comparison=resp.price_comparison,
-                    )
-                    results.setdefault(name, []).append((domain, dcr))
-                    cache.set(
-                        domain, (dcr.available, dcr.registrar_price_usd, dcr.provider, dcr.error)
-                    )
-        else:
-            # Traditional individual processing
-            tasks: List[Tuple[str, str, asyncio.Task[ProviderResponse]]] = []
-            for name, domain in domains_to_check:
-                tasks.append((name, domain, asyncio.create_task(_fetch_best(domain))))
-
-            for name, domain, task in tasks:
-                try:
-                    resp = await task
-                except Exception as e:
-                    resp = ProviderResponse(None, None, "error", str(e))
-                dcr = DomainCheckResult(
-                    domain=domain,
-                    available=resp.available,
-                    registrar_price_usd=resp.price_usd,
-                    provider=resp.provider,
-                    error=resp.error,
-                    price_comparison=resp.price_comparison,
-                )
-                results.setdefault(name, []).append((domain, dcr))
-                cache.set(domain, (dcr.available, dcr.registrar_price_usd, dcr.provider, dcr.error))
 
-        return results
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop on a daemon thread, created once and shared by every `check_domains` call."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="domain-check-loop", daemon=True).start()
+            _loop = loop
+        return _loop
 
-    return asyncio.run(_run())
+
+def check_domains(
+    domain_candidates: Dict[str, List[str]],
+) -> Dict[str, List[Tuple[str, DomainCheckResult]]]:
+    # Warm-cache runs need no lookups, so answer them without touching the event loop
+    cache = _open_cache()
+    try:
+        cached = _all_cached(cache, domain_candidates)
+    finally:
+        cache.close()
+    if cached is not None:
+        return cached
+    # Runs on a long-lived background loop rather than asyncio.run, so repeated calls do
+    # not rebuild an event loop each time; this also works when the caller is itself
+    # inside a running loop (notebook, async handler)
+    future = asyncio.run_coroutine_threadsafe(acheck_domains(domain_candidates), _background_loop())
+    return future.result()
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import os
-from typing import Optional
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 import time
+import weakref
 
 # Import httpx only when available
 try:
@@ -14,34 +19,74 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 from ..models import RegistrarPrice, PriceComparison
+from ..utils import fastjson
+from ..utils.http import client_scope
 
 # Configuration - Base URLs (static)
 NAMECOM_BASE = os.getenv("NAME_COM_BASE", "https://api.dev.name.com/v4")
 GODADDY_BASE = "https://api.godaddy.com/v1"
 CLOUDFLARE_BASE = "https://api.cloudflare.com/client/v4"
 NAMECHEAP_BASE = "https://api.namecheap.com/xml.response"
-
-
-# Credential getters - read dynamically for test compatibility
+# API base of each registrar that is actually called (Cloudflare is a stub for now)
+REGISTRAR_API_BASES = {
+    "namecom": NAMECOM_BASE,
+    "godaddy": GODADDY_BASE,
+    "namecheap": NAMECHEAP_BASE,
+}
+NAMECOM_CHECK_URL = f"{NAMECOM_BASE}/domains:checkAvailability"
+GODADDY_AVAILABLE_URL = f"{GODADDY_BASE}/domains/available"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Registration links, filled in only for available domains
+NAMECOM_SEARCH_URL = "https://www.name.com/domain/search/{}"
+GODADDY_SEARCH_URL = "https://www.godaddy.com/domainsearch/find?domainToCheck={}"
+NAMECHEAP_SEARCH_URL = "https://www.namecheap.com/domains/registration/results/?domain={}"
+# Domains per bulk availability request: Name.com checkAvailability takes up to 50,
+# GoDaddy's bulk /domains/available up to 500, namecheap.domains.check up to 50
+NAMECOM_BATCH_SIZE = 50
+GODADDY_BATCH_SIZE = 500
+NAMECHEAP_BATCH_SIZE = 50
+
+
+# Credential getters - read lazily (after load_env) and cached for the process lifetime;
+# call reset_env_cache() after changing the environment
+@functools.lru_cache(maxsize=1)
 def _get_namecom_credentials():
-    """Get Name.com credentials dynamically."""
+    """Get Name.com credentials."""
     username = os.getenv("NAME_COM_USERNAME") or os.getenv("name_com_DEV_USERNAME")
     token = os.getenv("NAME_COM_API_KEY") or os.getenv("name_com_DEV_API_KEY")
     return username, token
 
 
+@functools.lru_cache(maxsize=1)
 def _get_godaddy_credentials():
-    """Get GoDaddy credentials dynamically."""
+    """Get GoDaddy credentials."""
     return os.getenv("GODADDY_API_KEY"), os.getenv("GODADDY_API_SECRET")
 
 
+# Auth objects are built once per credential pair rather than per request; keying the
+# cache on the values means refreshed credentials simply get their own entry
+@functools.lru_cache(maxsize=4)
+def _namecom_auth(username: str, token: str) -> httpx.BasicAuth:
+    return httpx.BasicAuth(username, token)
+
+
+@functools.lru_cache(maxsize=4)
+def _godaddy_headers(api_key: str, api_secret: str) -> dict:
+    return {
+        "Authorization": f"sso-key {api_key}:{api_secret}",
+        "Content-Type": "application/json",
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def _get_cloudflare_credentials():
-    """Get Cloudflare credentials dynamically."""
+    """Get Cloudflare credentials."""
     return os.getenv("CLOUDFLARE_API_TOKEN")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_namecheap_credentials():
-    """Get Namecheap credentials dynamically."""
+    """Get Namecheap credentials."""
     return os.getenv("NAMECHEAP_API_USER"), os.getenv("NAMECHEAP_API_KEY")
 
 
@@ -55,125 +100,248 @@ REGISTRAR_RATE_LIMITS = {
 
 
 # Enabled registrars (can be disabled via environment)
+@functools.lru_cache(maxsize=8)
 def _is_registrar_enabled(name: str) -> bool:
     """Check if a registrar is enabled via environment variable."""
     return os.getenv(f"ENABLE_{name.upper()}", "1") == "1"
 
 
+def reset_env_cache() -> None:
+    """Forget cached credentials and registrar toggles so environment changes are picked up."""
+    _get_namecom_credentials.cache_clear()
+    _get_godaddy_credentials.cache_clear()
+    _get_cloudflare_credentials.cache_clear()
+    _get_namecheap_credentials.cache_clear()
+    _is_registrar_enabled.cache_clear()
+    _enabled_registrars.cache_clear()
+
+
 class RateLimiter:
-    """Simple rate limiter for each registrar."""
+    """Token-bucket rate limiter for each registrar: up to `burst` calls pass at once,
+    then one per 1/rps seconds."""
 
-    def __init__(self, rps: float):
+    def __init__(self, rps: float, burst: int = 1):
         self.rps = rps
-        self.last_call = 0
+        self.burst = max(1, burst)
+        self.interval_ns = int(1e9 / rps) if rps > 0 else 0
+        # Theoretical arrival time (ns) of the next call when the bucket is empty; the
+        # bucket is full whenever this is `burst` intervals or more in the past
+        self.next_slot_ns = 0
 
     async def acquire(self):
         if self.rps <= 0:
             return
-        now = time.time()
-        elapsed = now - self.last_call
-        min_interval = 1.0 / self.rps
-        if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
-        self.last_call = time.time()
+        # Reserve a slot before sleeping, so concurrent callers queue up one interval
+        # apart instead of all waking at the same moment; no lock is needed because the
+        # reservation happens without yielding. Monotonic clock: interval timing must not
+        # jump with wall-clock adjustments.
+        now = time.monotonic_ns()
+        slot = max(now, self.next_slot_ns)
+        self.next_slot_ns = slot + self.interval_ns
+        # Spare tokens let the first `burst - 1` queued callers go ahead of their slot
+        ready = slot - (self.burst - 1) * self.interval_ns
+        if ready > now:
+            await asyncio.sleep((ready - now) / 1e9)
 
 
 # Rate limiters for each registrar
-rate_limiters = {name: RateLimiter(rps) for name, rps in REGISTRAR_RATE_LIMITS.items()}
+rate_limiters = {
+    name: RateLimiter(rps, int(os.getenv(f"{name.upper()}_BURST", "1")))
+    for name, rps in REGISTRAR_RATE_LIMITS.items()
+}
 
+# Cap on concurrent requests per registrar, so a large sweep does not open a socket per
+# queued domain even though the rate limiter spaces out their start times
+REGISTRAR_MAX_INFLIGHT = {
+    name: max(1, int(os.getenv(f"{name.upper()}_MAX_INFLIGHT", "4")))
+    for name in REGISTRAR_RATE_LIMITS
+}
+# Semaphores bind to an event loop, so keep one set per running loop
+_inflight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
-async def get_namecom_price(domain: str) -> RegistrarPrice:
+
+def _inflight_limit(name: str) -> asyncio.Semaphore:
+    sems = _inflight.setdefault(asyncio.get_running_loop(), {})
+    sem = sems.get(name)
+    if sem is None:
+        sem = sems[name] = asyncio.Semaphore(REGISTRAR_MAX_INFLIGHT[name])
+    return sem
+
+
+async def get_namecom_price(domain: str, client: httpx.AsyncClient | None = None) -> RegistrarPrice:
     """Get pricing from Name.com API."""
-    username, token = _get_namecom_credentials()
-    if not _is_registrar_enabled("namecom") or not (username and token):
-        return RegistrarPrice("namecom", None, error="missing_credentials_or_disabled")
+    return (await get_namecom_prices([domain], client=client))[domain]
 
-    await rate_limiters["namecom"].acquire()
-    url = f"{NAMECOM_BASE}/domains:checkAvailability"
-    payload = {"domainNames": [domain]}
 
-    try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(url, json=payload, auth=(username, token))
-            resp.raise_for_status()
-            data = resp.json()
-            item = data.get("results", [{}])[0]
+async def get_namecom_prices(
+    domains: List[str], client: httpx.AsyncClient | None = None
+) -> Dict[str, RegistrarPrice]:
+    """Price many domains with Name.com, NAMECOM_BATCH_SIZE per checkAvailability call."""
+    username, token = _get_namecom_credentials()
+    if not _is_registrar_enabled("namecom") or not (username and token):
+        return {
+            d: RegistrarPrice("namecom", None, error="missing_credentials_or_disabled")
+            for d in domains
+        }
 
-            available = bool(item.get("purchasable", False))
+    out: Dict[str, RegistrarPrice] = {}
+    for i in range(0, len(domains), NAMECOM_BATCH_SIZE):
+        chunk = domains[i : i + NAMECOM_BATCH_SIZE]
+        await rate_limiters["namecom"].acquire()
+        payload = {"domainNames": chunk}
+        try:
+            async with _inflight_limit("namecom"), client_scope(client, timeout=10) as http:
+                resp = await http.post(
+                    NAMECOM_CHECK_URL,
+                    content=fastjson.dumps(payload),
+                    headers=_JSON_HEADERS,
+                    auth=_namecom_auth(username, token),
+                )
+                resp.raise_for_status()
+                items = fastjson.loads(resp.content).get("results", [])
+        except Exception as e:
+            for domain in chunk:
+                out[domain] = RegistrarPrice("namecom", None, error=str(e))
+            continue
+        for domain, item in zip(chunk, match_namecom_results(chunk, items)):
+            out[domain] = (
+                _namecom_price(domain, item)
+                if item is not None
+                else RegistrarPrice("namecom", None, error="missing_result")
+            )
+    return out
+
+
+def match_namecom_results(domains: List[str], items: List[dict]) -> List[Optional[dict]]:
+    """Line up checkAvailability results with the requested `domains`.
+
+    Results are matched by domainName; results without one follow request order.
+    """
+    by_name = {str(item.get("domainName", "")).lower(): item for item in items}
+    matched: List[Optional[dict]] = []
+    for j, domain in enumerate(domains):
+        item = by_name.get(domain.lower())
+        if item is None and j < len(items) and "domainName" not in items[j]:
+            item = items[j]
+        matched.append(item)
+    return matched
+
+
+def _namecom_price(domain: str, item: dict) -> RegistrarPrice:
+    available = bool(item.get("purchasable", False))
+    price = None
+    renewal_price = None
+
+    if "purchasePrice" in item and isinstance(item["purchasePrice"], dict):
+        amount = item["purchasePrice"].get("amount")
+        try:
+            price = float(amount) if amount is not None else None
+        except Exception:
             price = None
+
+    if "renewalPrice" in item and isinstance(item["renewalPrice"], dict):
+        amount = item["renewalPrice"].get("amount")
+        try:
+            renewal_price = float(amount) if amount is not None else None
+        except Exception:
             renewal_price = None
 
-            if "purchasePrice" in item and isinstance(item["purchasePrice"], dict):
-                amount = item["purchasePrice"].get("amount")
-                try:
-                    price = float(amount) if amount is not None else None
-                except Exception:
-                    price = None
-
-            if "renewalPrice" in item and isinstance(item["renewalPrice"], dict):
-                amount = item["renewalPrice"].get("amount")
-                try:
-                    renewal_price = float(amount) if amount is not None else None
-                except Exception:
-                    renewal_price = None
-
-            return RegistrarPrice(
-                registrar="namecom",
-                price_usd=price,
-                is_available=available,
-                renewal_price_usd=renewal_price,
-                registration_url=(
-                    f"https://www.name.com/domain/search/{domain}" if available else None
-                ),
-            )
-    except Exception as e:
-        return RegistrarPrice("namecom", None, error=str(e))
+    return RegistrarPrice(
+        registrar="namecom",
+        price_usd=price,
+        is_available=available,
+        renewal_price_usd=renewal_price,
+        registration_url=NAMECOM_SEARCH_URL.format(domain) if available else None,
+    )
 
 
-async def get_godaddy_price(domain: str) -> RegistrarPrice:
+async def get_godaddy_price(domain: str, client: httpx.AsyncClient | None = None) -> RegistrarPrice:
     """Get pricing from GoDaddy API."""
     api_key, api_secret = _get_godaddy_credentials()
     if not _is_registrar_enabled("godaddy") or not (api_key and api_secret):
         return RegistrarPrice("godaddy", None, error="missing_credentials_or_disabled")
 
     await rate_limiters["godaddy"].acquire()
-    url = f"{GODADDY_BASE}/domains/available"
-    headers = {
-        "Authorization": f"sso-key {api_key}:{api_secret}",
-        "Content-Type": "application/json",
-    }
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(f"{url}?domain={domain}", headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-
-            available = data.get("available", False)
-            price = data.get("price")  # GoDaddy returns price in micros sometimes
-
-            # Convert price if needed
-            if price and isinstance(price, dict):
-                price = float(price.get("amount", 0)) / 1_000_000  # Convert from micros
-            elif price:
-                # GoDaddy price is typically in micros (even when it's a plain number)
-                price = float(price) / 1_000_000
-
-            return RegistrarPrice(
-                registrar="godaddy",
-                price_usd=price,
-                is_available=available,
-                registration_url=(
-                    f"https://www.godaddy.com/domainsearch/find?domainToCheck={domain}"
-                    if available
-                    else None
-                ),
+        async with _inflight_limit("godaddy"), client_scope(client, timeout=10) as client:
+            resp = await client.get(
+                f"{GODADDY_AVAILABLE_URL}?domain={domain}",
+                headers=_godaddy_headers(api_key, api_secret),
             )
+            resp.raise_for_status()
+            return _godaddy_price(domain, fastjson.loads(resp.content))
     except Exception as e:
         return RegistrarPrice("godaddy", None, error=str(e))
 
 
-async def get_cloudflare_price(domain: str) -> RegistrarPrice:
+async def get_godaddy_prices(
+    domains: List[str], client: httpx.AsyncClient | None = None
+) -> Dict[str, RegistrarPrice]:
+    """Price many domains with GoDaddy's bulk availability endpoint, GODADDY_BATCH_SIZE per call."""
+    api_key, api_secret = _get_godaddy_credentials()
+    if not _is_registrar_enabled("godaddy") or not (api_key and api_secret):
+        return {
+            d: RegistrarPrice("godaddy", None, error="missing_credentials_or_disabled")
+            for d in domains
+        }
+
+    out: Dict[str, RegistrarPrice] = {}
+    for i in range(0, len(domains), GODADDY_BATCH_SIZE):
+        chunk = domains[i : i + GODADDY_BATCH_SIZE]
+        await rate_limiters["godaddy"].acquire()
+        try:
+            async with _inflight_limit("godaddy"), client_scope(client, timeout=10) as http:
+                resp = await http.post(
+                    GODADDY_AVAILABLE_URL,
+                    params={"checkType": "FAST"},
+                    content=fastjson.dumps(chunk),
+                    headers=_godaddy_headers(api_key, api_secret),
+                )
+                resp.raise_for_status()
+                data = fastjson.loads(resp.content)
+        except Exception as e:
+            for domain in chunk:
+                out[domain] = RegistrarPrice("godaddy", None, error=str(e))
+            continue
+        # Checked domains come back under "domains", per-domain failures under "errors"
+        found = {str(item.get("domain", "")).lower(): item for item in data.get("domains", [])}
+        failed = {
+            str(err.get("domain", "")).lower(): err.get("code") or err.get("message")
+            for err in data.get("errors", [])
+        }
+        for domain in chunk:
+            item = found.get(domain.lower())
+            if item is not None:
+                out[domain] = _godaddy_price(domain, item)
+            else:
+                error = failed.get(domain.lower()) or "missing_result"
+                out[domain] = RegistrarPrice("godaddy", None, error=str(error))
+    return out
+
+
+def _godaddy_price(domain: str, data: dict) -> RegistrarPrice:
+    available = data.get("available", False)
+    price = data.get("price")  # GoDaddy returns price in micros sometimes
+
+    # Convert price if needed
+    if price and isinstance(price, dict):
+        price = float(price.get("amount", 0)) / 1_000_000  # Convert from micros
+    elif price:
+        # GoDaddy price is typically in micros (even when it's a plain number)
+        price = float(price) / 1_000_000
+
+    return RegistrarPrice(
+        registrar="godaddy",
+        price_usd=price,
+        is_available=available,
+        registration_url=GODADDY_SEARCH_URL.format(domain) if available else None,
+    )
+
+
+async def get_cloudflare_price(
+    domain: str, client: httpx.AsyncClient | None = None
+) -> RegistrarPrice:
     """Get pricing from Cloudflare Registrar API."""
     api_token = _get_cloudflare_credentials()
     if not _is_registrar_enabled("cloudflare") or not api_token:
@@ -196,67 +364,118 @@ async def get_cloudflare_price(domain: str) -> RegistrarPrice:
         return RegistrarPrice("cloudflare", None, error=str(e))
 
 
-async def get_namecheap_price(domain: str) -> RegistrarPrice:
+async def get_cloudflare_prices(
+    domains: List[str], client: httpx.AsyncClient | None = None
+) -> Dict[str, RegistrarPrice]:
+    """Batch form of `get_cloudflare_price`."""
+    if not domains:
+        return {}
+    # The registrar API is not public, so nothing goes over the wire: one stub result
+    # (and one rate-limiter slot) stands in for the whole batch
+    stub = await get_cloudflare_price(domains[0], client=client)
+    return {d: dataclasses.replace(stub) for d in domains}
+
+
+async def get_namecheap_price(
+    domain: str, client: httpx.AsyncClient | None = None
+) -> RegistrarPrice:
     """Get pricing from Namecheap API."""
+    return (await get_namecheap_prices([domain], client=client))[domain]
+
+
+async def get_namecheap_prices(
+    domains: List[str], client: httpx.AsyncClient | None = None
+) -> Dict[str, RegistrarPrice]:
+    """Check many domains with Namecheap, NAMECHEAP_BATCH_SIZE per domains.check call."""
     api_user, api_key = _get_namecheap_credentials()
     if not _is_registrar_enabled("namecheap") or not (api_user and api_key):
-        return RegistrarPrice("namecheap", None, error="missing_credentials_or_disabled")
-
-    await rate_limiters["namecheap"].acquire()
+        return {
+            d: RegistrarPrice("namecheap", None, error="missing_credentials_or_disabled")
+            for d in domains
+        }
 
-    try:
-        # Namecheap uses XML API - this is a simplified implementation
+    out: Dict[str, RegistrarPrice] = {}
+    for i in range(0, len(domains), NAMECHEAP_BATCH_SIZE):
+        chunk = domains[i : i + NAMECHEAP_BATCH_SIZE]
+        await rate_limiters["namecheap"].acquire()
         params = {
             "ApiUser": api_user,
             "ApiKey": api_key,
             "UserName": api_user,
             "Command": "namecheap.domains.check",
             "ClientIp": "127.0.0.1",  # You'd need to get actual client IP
-            "DomainList": domain,
+            "DomainList": ",".join(chunk),
         }
-
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(NAMECHEAP_BASE, params=params)
-            resp.raise_for_status()
-
-            # Parse XML response (simplified - you'd want proper XML parsing)
-            text = resp.text
-            available = 'Available="true"' in text
-
-            # Namecheap doesn't typically return pricing in availability check
-            # You'd need separate pricing API calls
-            return RegistrarPrice(
+        try:
+            async with _inflight_limit("namecheap"), client_scope(client, timeout=10) as http:
+                resp = await http.get(NAMECHEAP_BASE, params=params)
+                resp.raise_for_status()
+                found = _parse_namecheap_check(resp.content)
+        except Exception as e:
+            for domain in chunk:
+                out[domain] = RegistrarPrice("namecheap", None, error=str(e))
+            continue
+        for domain in chunk:
+            available = found.get(domain.lower())
+            if available is None:
+                out[domain] = RegistrarPrice("namecheap", None, error="missing_result")
+                continue
+            # Namecheap doesn't return pricing in the availability check; that would
+            # need a separate pricing call
+            out[domain] = RegistrarPrice(
                 registrar="namecheap",
-                price_usd=None,  # Would need separate pricing call
+                price_usd=None,
                 is_available=available,
-                registration_url=(
-                    f"https://www.namecheap.com/domains/registration/results/?domain={domain}"
-                    if available
-                    else None
-                ),
+                registration_url=NAMECHEAP_SEARCH_URL.format(domain) if available else None,
                 error="pricing_requires_separate_api_call",
             )
-    except Exception as e:
-        return RegistrarPrice("namecheap", None, error=str(e))
+    return out
+
+
+def _parse_namecheap_check(body: bytes) -> Dict[str, bool]:
+    """Map each DomainCheckResult in a domains.check response to its availability."""
+    found: Dict[str, bool] = {}
+    for _, elem in ET.iterparse(BytesIO(body), events=("end",)):
+        # Tags carry the response namespace, e.g. "{http://api.namecheap.com/xml.response}..."
+        if elem.tag.rpartition("}")[2] == "DomainCheckResult":
+            found[elem.get("Domain", "").lower()] = elem.get("Available", "").lower() == "true"
+            elem.clear()
+    return found
+
+
+_PriceFetch = Callable[..., Awaitable[RegistrarPrice]]
+_BatchPriceFetch = Callable[..., Awaitable[Dict[str, RegistrarPrice]]]
+
+
+@functools.lru_cache(maxsize=1)
+def _enabled_registrars() -> Tuple[Tuple[str, _PriceFetch, _BatchPriceFetch], ...]:
+    """Dispatch table of enabled registrars, built once (cleared by reset_env_cache).
+
+    Each entry carries the single-domain fetcher and its batch form.
+    """
+    registrars = (
+        ("namecom", get_namecom_price, get_namecom_prices),
+        ("godaddy", get_godaddy_price, get_godaddy_prices),
+        ("cloudflare", get_cloudflare_price, get_cloudflare_prices),
+        ("namecheap", get_namecheap_price, get_namecheap_prices),
+    )
+    return tuple(entry for entry in registrars if _is_registrar_enabled(entry[0]))
+
 
+async def get_multi_registrar_pricing(
+    domain: str, client: httpx.AsyncClient | None = None
+) -> PriceComparison:
+    """Get pricing from all enabled registrars in parallel.
 
-async def get_multi_registrar_pricing(domain: str) -> PriceComparison:
-    """Get pricing from all enabled registrars in parallel."""
+    Pass `client` to share one connection pool across registrars (and across domains).
+    """
     if not HTTPX_AVAILABLE:
         # Return stub pricing when httpx not available
         return PriceComparison(domain, [RegistrarPrice("stub", None, error="httpx_not_available")])
 
-    tasks = []
-
-    if _is_registrar_enabled("namecom"):
-        tasks.append(("namecom", get_namecom_price(domain)))
-    if _is_registrar_enabled("godaddy"):
-        tasks.append(("godaddy", get_godaddy_price(domain)))
-    if _is_registrar_enabled("cloudflare"):
-        tasks.append(("cloudflare", get_cloudflare_price(domain)))
-    if _is_registrar_enabled("namecheap"):
-        tasks.append(("namecheap", get_namecheap_price(domain)))
-
+    tasks = [
+        (registrar, fetch(domain, client=client)) for registrar, fetch, _ in _enabled_registrars()
+    ]
     if not tasks:
         return PriceComparison(domain, [])
 
@@ -273,8 +492,41 @@ async def get_multi_registrar_pricing(domain: str) -> PriceComparison:
     return PriceComparison(domain, prices)
 
 
+async def get_multi_registrar_pricing_batch(
+    domains: List[str], client: httpx.AsyncClient | None = None
+) -> Dict[str, PriceComparison]:
+    """Batch form of `get_multi_registrar_pricing`.
+
+    Each registrar is asked once per batch through its bulk endpoint (where it has one)
+    instead of once per domain; registrars still run in parallel.
+    """
+    if not HTTPX_AVAILABLE:
+        return {
+            d: PriceComparison(d, [RegistrarPrice("stub", None, error="httpx_not_available")])
+            for d in domains
+        }
+
+    registrars = _enabled_registrars()
+    results = await asyncio.gather(
+        *(fetch_many(domains, client=client) for _, _, fetch_many in registrars),
+        return_exceptions=True,
+    )
+
+    out: Dict[str, PriceComparison] = {}
+    for domain in domains:
+        prices = []
+        for (registrar, _, _), result in zip(registrars, results):
+            if isinstance(result, Exception):
+                prices.append(RegistrarPrice(registrar, None, error=str(result)))
+            else:
+                prices.append(result[domain])
+        out[domain] = PriceComparison(domain, prices)
+    return out
+
+
 # Legacy function for backward compatibility
-async def get_namecom_price_legacy(domain: str) -> Optional[float]:
+async def get_namecom_price_legacy(
+    domain: str, client: httpx.AsyncClient | None = None
+) -> Optional[float]:
     """Legacy function for backward compatibility."""
-    result = await get_namecom_price(domain)
-    return result.price_usd
+    return (await get_namecom_price(domain, client=client)).price_usd
@@ -1,63 +1,398 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import os
 import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Stay under SQLite's default SQLITE_MAX_VARIABLE_NUMBER (999 before 3.32)
+_MAX_SQL_PARAMS = 900
+
+# Process-wide LRU of recently read/written (row, timestamp) pairs keyed by (db path, domain),
+# so hot domains in repeated runs are served from memory instead of SQLite
+_MEMO_SIZE = max(0, int(os.getenv("DOMAIN_CACHE_MEM_SIZE", "4096")))
+_memo: OrderedDict = OrderedDict()
+_memo_lock = threading.Lock()
+
+# Entries that recorded a provider error are retried after this long
+DEFAULT_ERROR_TTL_SECONDS = 300.0
+
+# Registrar price rows are served for this long after they were fetched
+DEFAULT_PRICE_TTL_SECONDS = 86400.0
+
+# Bumped whenever the schema changes; tracked in SQLite's user_version header field.
+# 1: domain_cache rebuilt WITHOUT ROWID with a ts column; 2: registrar_prices added
+_SCHEMA_VERSION = 2
+_CREATE_TABLE_SQL = """
+    CREATE TABLE {name} (
+        domain TEXT PRIMARY KEY,
+        available INTEGER,
+        price_usd REAL,
+        provider TEXT,
+        error TEXT,
+        ts REAL
+    ) WITHOUT ROWID
+"""
+# One row per registrar quote, kept in the order the registrars were asked (pos)
+_CREATE_PRICES_SQL = """
+    CREATE TABLE IF NOT EXISTS registrar_prices (
+        domain TEXT NOT NULL,
+        pos INTEGER NOT NULL,
+        registrar TEXT,
+        price_usd REAL,
+        currency TEXT,
+        available INTEGER,
+        registration_url TEXT,
+        renewal_usd REAL,
+        transfer_usd REAL,
+        error TEXT,
+        fetched_at REAL,
+        PRIMARY KEY (domain, pos)
+    ) WITHOUT ROWID
+"""
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+# Statements are compiled once per connection and reused from sqlite3's statement cache,
+# which is keyed on the exact SQL text, so the texts are built once here
+_STATEMENT_CACHE_SIZE = 128
+# An upsert updates an existing row in place; REPLACE would delete it and insert anew
+_UPSERT_SQL = (
+    "INSERT INTO domain_cache(domain, available, price_usd, provider, error, ts) "
+    "VALUES(?,?,?,?,?,?) ON CONFLICT(domain) DO UPDATE SET "
+    "available=excluded.available, price_usd=excluded.price_usd, "
+    "provider=excluded.provider, error=excluded.error, ts=excluded.ts"
+)
+
+
+@functools.lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _select_sql(n: int) -> str:
+    return (
+        "SELECT domain, available, price_usd, provider, error, ts FROM domain_cache "
+        f"WHERE domain IN ({','.join('?' * n)})"
+    )
+
+
+_INSERT_PRICE_SQL = "INSERT INTO registrar_prices VALUES(?,?,?,?,?,?,?,?,?,?,?)"
+
+
+@functools.lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _select_prices_sql(n: int) -> str:
+    return (
+        "SELECT domain, registrar, price_usd, currency, available, registration_url, "
+        "renewal_usd, transfer_usd, error, fetched_at FROM registrar_prices "
+        f"WHERE domain IN ({','.join('?' * n)}) ORDER BY domain, pos"
+    )
+
+
+@functools.lru_cache(maxsize=_STATEMENT_CACHE_SIZE)
+def _delete_prices_sql(n: int) -> str:
+    return f"DELETE FROM registrar_prices WHERE domain IN ({','.join('?' * n)})"
+
+
+def _decode(row) -> Tuple[Optional[bool], Optional[float], Optional[str], Optional[str]]:
+    available = None if row[0] is None else bool(row[0])
+    # price_usd has REAL affinity, so SQLite already hands back a float (or None)
+    # Providers come from a handful of names; interning lets memoized rows share them
+    provider = None if row[2] is None else sys.intern(row[2])
+    return (available, row[1], provider, row[3])
+
+
+def _memo_get(key: Tuple[Optional[str], str]):
+    if key[0] is None:
+        return None
+    with _memo_lock:
+        row = _memo.get(key)
+        if row is not None:
+            _memo.move_to_end(key)
+        return row
+
+
+def _memo_put(key: Tuple[Optional[str], str], row) -> None:
+    if key[0] is None:
+        return
+    with _memo_lock:
+        _memo[key] = row
+        _memo.move_to_end(key)
+        if len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def _memo_forget(path: Optional[str]) -> None:
+    # A new database at a known path must not be served the previous file's rows
+    if path is None:
+        return
+    with _memo_lock:
+        for key in [k for k in _memo if k[0] == path]:
+            del _memo[key]
 
 
 class DomainCache:
-    def __init__(self, db_path: str):
+    """SQLite-backed availability cache.
+
+    One connection is kept open for the life of the instance (autocommit, WAL) instead of
+    reconnecting on every lookup. Rows read or written are also kept in a process-local
+    memory LRU that serves fresh entries without touching SQLite, so a row another process
+    commits later is only seen once the memoized entry is evicted or expires.
+    Successful lookups are kept indefinitely; entries recording an error expire after
+    `error_ttl_seconds` so failed domains are retried on a later run. Per-registrar price
+    quotes live alongside them; after `price_ttl_seconds` they are reported as expired.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        error_ttl_seconds: float = DEFAULT_ERROR_TTL_SECONDS,
+        synchronous: str = "NORMAL",
+        price_ttl_seconds: float = DEFAULT_PRICE_TTL_SECONDS,
+    ):
         self.path = Path(db_path)
+        self.error_ttl_seconds = error_ttl_seconds
+        self.price_ttl_seconds = price_ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # In-memory databases are private to their connection, so they share no memo key
+        in_memory = db_path in ("", ":memory:")
+        self._memo_path = None if in_memory else str(self.path.resolve())
+        self._bulk_rows: Optional[List[tuple]] = None
+        self._conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        # WAL + synchronous=NORMAL: commits append to the log without an fsync each;
+        # FULL restores per-commit durability at the cost of write throughput
+        if synchronous.upper() not in _SYNCHRONOUS_MODES:
+            synchronous = "NORMAL"
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute("PRAGMA cache_size=-20000")
         self._ensure()
 
     def _ensure(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(self.path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS domain_cache (
-                    domain TEXT PRIMARY KEY,
-                    available INTEGER,
-                    price_usd REAL,
-                    provider TEXT,
-                    error TEXT
-                )
-                """
-            )
-            conn.commit()
+        if self._schema_version() >= _SCHEMA_VERSION:
+            return
+        # IMMEDIATE takes the write lock up front, so two processes opening an old cache
+        # at once migrate it only once
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = self._schema_version()
+            if version < _SCHEMA_VERSION:
+                self._migrate(version)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _schema_version(self) -> int:
+        return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _migrate(self, version: int) -> None:
+        if version < 1:
+            self._migrate_domain_cache()
+        if version < 2:
+            self._conn.execute(_CREATE_PRICES_SQL)
+        self._conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    def _migrate_domain_cache(self) -> None:
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(domain_cache)")}
+        if not columns:
+            self._conn.execute(_CREATE_TABLE_SQL.format(name="domain_cache"))
+            _memo_forget(self._memo_path)
+            return
+        # Rebuild as a WITHOUT ROWID table clustered on domain; caches created before
+        # entries were timestamped lack the ts column
+        ts = "ts" if "ts" in columns else "NULL"
+        self._conn.execute(_CREATE_TABLE_SQL.format(name="domain_cache_v1"))
+        self._conn.execute(
+            "INSERT INTO domain_cache_v1 "
+            f"SELECT domain, available, price_usd, provider, error, {ts} FROM domain_cache"
+        )
+        self._conn.execute("DROP TABLE domain_cache")
+        self._conn.execute("ALTER TABLE domain_cache_v1 RENAME TO domain_cache")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _fresh(self, error: Optional[str], ts: Optional[float], now: float) -> bool:
+        # Untimestamped error rows predate the TTL and are treated as expired
+        return error is None or (ts is not None and now - ts <= self.error_ttl_seconds)
 
     def get(
         self, domain: str
     ) -> Optional[Tuple[Optional[bool], Optional[float], Optional[str], Optional[str]]]:
-        with sqlite3.connect(self.path) as conn:
-            cur = conn.execute(
-                "SELECT available, price_usd, provider, error FROM domain_cache WHERE domain=?",
-                (domain,),
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
-            available = None if row[0] is None else bool(row[0])
-            price = None if row[1] is None else float(row[1])
-            provider = row[2]
-            error = row[3]
-            return (available, price, provider, error)
+        return self.get_many([domain]).get(domain)
+
+    def get_many(
+        self, domains: Iterable[str]
+    ) -> Dict[str, Tuple[Optional[bool], Optional[float], Optional[str], Optional[str]]]:
+        """Look up many domains at once; domains not in the cache (or expired) are absent."""
+        now = time.time()
+        found: Dict[str, Tuple[Optional[bool], Optional[float], Optional[str], Optional[str]]] = {}
+        misses = []
+        for domain in dict.fromkeys(domains):
+            memoized = _memo_get((self._memo_path, domain))
+            if memoized is not None and self._fresh(memoized[0][3], memoized[1], now):
+                found[domain] = memoized[0]
+            else:
+                # Unknown or an expired error: re-read, another writer may have replaced it
+                misses.append(domain)
+        for i in range(0, len(misses), _MAX_SQL_PARAMS):
+            chunk = misses[i : i + _MAX_SQL_PARAMS]
+            cur = self._conn.execute(_select_sql(len(chunk)), chunk)
+            for row in cur:
+                decoded = _decode(row[1:5])
+                _memo_put((self._memo_path, row[0]), (decoded, row[5]))
+                if self._fresh(decoded[3], row[5], now):
+                    found[row[0]] = decoded
+        return found
 
     def set(
         self,
         domain: str,
         data: Tuple[Optional[bool], Optional[float], Optional[str], Optional[str]],
     ) -> None:
-        available, price, provider, error = data
-        with sqlite3.connect(self.path) as conn:
-            conn.execute(
-                "REPLACE INTO domain_cache(domain, available, price_usd, provider, error) VALUES(?,?,?,?,?)",
-                (
-                    domain,
-                    None if available is None else int(bool(available)),
-                    price,
-                    provider,
-                    error,
-                ),
+        self.set_many([(domain, data)])
+
+    def set_many(
+        self,
+        items: Iterable[
+            Tuple[str, Tuple[Optional[bool], Optional[float], Optional[str], Optional[str]]]
+        ],
+    ) -> None:
+        """Write several (domain, data) entries in a single transaction."""
+        now = time.time()
+        rows = [
+            (
+                domain,
+                None if available is None else int(bool(available)),
+                None if price is None else float(price),
+                provider,
+                error,
+                now,
             )
-            conn.commit()
+            for domain, (available, price, provider, error) in items
+        ]
+        if not rows:
+            return
+        if self._bulk_rows is not None:
+            # Inside bulk(): its transaction commits (and publishes to the memo) at the end
+            self._conn.executemany(_UPSERT_SQL, rows)
+            self._bulk_rows.extend(rows)
+            return
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(_UPSERT_SQL, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self._memoize(rows)
+
+    def get_prices_many(self, domains: Iterable[str]) -> Dict[str, Optional[List[tuple]]]:
+        """Stored registrar quotes, in the order they were stored.
+
+        Each quote is a tuple in `RegistrarPrice` field order. Domains whose quotes are
+        past the price TTL map to None (the domain is due to be re-priced); domains with
+        no stored quotes are absent.
+        """
+        cutoff = time.time() - self.price_ttl_seconds
+        domains = list(dict.fromkeys(domains))
+        found: Dict[str, Optional[List[tuple]]] = {}
+        for i in range(0, len(domains), _MAX_SQL_PARAMS):
+            chunk = domains[i : i + _MAX_SQL_PARAMS]
+            for row in self._conn.execute(_select_prices_sql(len(chunk)), chunk):
+                # A domain's quotes are always replaced together, so they share fetched_at
+                if row[9] is None or row[9] <= cutoff:
+                    found[row[0]] = None
+                    continue
+                available = None if row[4] is None else bool(row[4])
+                found.setdefault(row[0], []).append(
+                    (sys.intern(row[1]), row[2], row[3], available, *row[5:9])
+                )
+        return found
+
+    def set_prices_many(self, items: Iterable[Tuple[str, Iterable[tuple]]]) -> None:
+        """Replace the stored quotes for each (domain, quotes) entry in one transaction.
+
+        Quotes are tuples in `RegistrarPrice` field order.
+        """
+        now = time.time()
+        domains: List[str] = []
+        rows = []
+        for domain, quotes in items:
+            domains.append(domain)
+            for pos, quote in enumerate(quotes):
+                available = None if quote[3] is None else int(bool(quote[3]))
+                rows.append((domain, pos, *quote[:3], available, *quote[4:], now))
+        if not domains:
+            return
+        if self._bulk_rows is not None:
+            self._write_prices(domains, rows)
+            return
+        self._conn.execute("BEGIN")
+        try:
+            self._write_prices(domains, rows)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _write_prices(self, domains: List[str], rows: List[tuple]) -> None:
+        for i in range(0, len(domains), _MAX_SQL_PARAMS):
+            chunk = domains[i : i + _MAX_SQL_PARAMS]
+            self._conn.execute(_delete_prices_sql(len(chunk)), chunk)
+        self._conn.executemany(_INSERT_PRICE_SQL, rows)
+
+    @contextlib.contextmanager
+    def bulk(self) -> Iterator["DomainCache"]:
+        """Group many set/set_many calls into one transaction, committed on exit."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._bulk_rows = []
+        try:
+            yield self
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+            self._memoize(self._bulk_rows)
+        finally:
+            self._bulk_rows = None
+
+    def _memoize(self, rows: List[tuple]) -> None:
+        for row in rows:
+            _memo_put((self._memo_path, row[0]), (_decode(row[1:5]), row[5]))
+
+
+class LLMCache:
+    """Completion text keyed by a hash of the request that produced it."""
+
+    def __init__(self, db_path: str):
+        self.path = Path(db_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One autocommit connection for the cache's lifetime, like DomainCache
+        self._conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._ensure()
+
+    def _ensure(self) -> None:
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT content FROM llm_cache WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        self._conn.execute("REPLACE INTO llm_cache(key, content) VALUES(?,?)", (key, content))
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+if TYPE_CHECKING:
+    import httpx
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@asynccontextmanager
+async def client_scope(
+    client: httpx.AsyncClient | None, **kwargs: Any
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield `client` if one is given, otherwise a new AsyncClient closed on exit.
+
+    Clients opened here negotiate HTTP/2 when h2 is installed, like the shared ones.
+    """
+    if client is not None:
+        yield client
+        return
+    import httpx
+
+    kwargs.setdefault("http2", HTTP2_AVAILABLE)
+    async with httpx.AsyncClient(**kwargs) as own_client:
+        yield own_client
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import functools
+from typing import List, Sequence, Tuple
 
 from metaphone import doublemetaphone
 
+_VOWELS = frozenset("aeiou")
+# Byte class table: 0 = not an ASCII letter, 1 = consonant, 2 = vowel (either case)
+_LETTER_CLASS = bytes(
+    (2 if chr(c).lower() in _VOWELS else 1) if chr(c).isascii() and chr(c).isalpha() else 0
+    for c in range(256)
+)
 
-def phonetic_similarity(a: str, b: str) -> float:
-    da = doublemetaphone(a or "")
-    db = doublemetaphone(b or "")
+
+@functools.lru_cache(maxsize=65536)
+def _encode(s: str) -> Tuple[str, str]:
+    # Each distinct string is metaphone-encoded once per process
+    return doublemetaphone(s)
+
+
+def _similarity(da: Tuple[str, str], db: Tuple[str, str]) -> float:
     score = 0.0
     if da[0] and da[0] == db[0]:
         score += 0.7
@@ -15,14 +28,20 @@ def phonetic_similarity(a: str, b: str) -> float:
     return score
 
 
-def vowel_consonant_balance(s: str) -> float:
-    if not s:
-        return 0.0
-    s2 = "".join(ch.lower() for ch in s if ch.isalpha())
-    if not s2:
+def phonetic_similarity(a: str, b: str) -> float:
+    return _similarity(_encode(a or ""), _encode(b or ""))
+
+
+def phonetic_similarities(a: str, others: Sequence[str]) -> List[float]:
+    """Batch version of `phonetic_similarity`: compare `a` against each of `others`."""
+    da = _encode(a or "")
+    return [_similarity(da, _encode(b or "")) for b in others]
+
+
+def _balance_from_counts(vowels: int, letters: int) -> float:
+    if not letters:
         return 0.0
-    vowels = sum(1 for ch in s2 if ch in "aeiou")
-    cons = max(1, len(s2) - vowels)
+    cons = max(1, letters - vowels)
     ratio = vowels / cons
     # Ideal ratio ~ 0.6–1.4; map to 0..1
     if ratio < 0.6:
@@ -30,3 +49,38 @@ def vowel_consonant_balance(s: str) -> float:
     if ratio > 1.4:
         return max(0.0, (2.0 - ratio) / 0.6)
     return 1.0
+
+
+def _ascii_balance(raw: bytes) -> float:
+    # Branch-free: classify every byte with one table lookup pass, then tally classes
+    classes = raw.translate(_LETTER_CLASS)
+    return _balance_from_counts(classes.count(2), len(classes) - classes.count(0))
+
+
+@functools.lru_cache(maxsize=16384)
+def vowel_consonant_balance(s: str) -> float:
+    if not s:
+        return 0.0
+    if s.isascii():
+        return _ascii_balance(s.encode("ascii"))
+    s2 = "".join(ch.lower() for ch in s if ch.isalpha())
+    vowels = sum(1 for ch in s2 if ch in _VOWELS)
+    return _balance_from_counts(vowels, len(s2))
+
+
+def vowel_consonant_balances(names: Sequence[str]) -> List[float]:
+    """Batch version of `vowel_consonant_balance` for a list of names.
+
+    ASCII names are packed into a single buffer that is encoded once and then sliced by
+    offset; anything else goes through the per-name path.
+    """
+    if not all(n.isascii() for n in names):
+        return [vowel_consonant_balance(n) for n in names]
+    buf = "".join(names).encode("ascii")
+    out: List[float] = []
+    start = 0
+    for n in names:
+        end = start + len(n)
+        out.append(_ascii_balance(buf[start:end]))
+        start = end
+    return out
@@ -0,0 +1,14 @@
+import pytest
+
+from domainidom import brainstorm
+from domainidom.services import domain_check
+
+
+@pytest.fixture(autouse=True)
+def _fresh_provider_env():
+    # Provider keys, registrar toggles and LLM settings are cached per process; tests set them
+    domain_check.reset_env_cache()
+    brainstorm.reset_env_cache()
+    yield
+    domain_check.reset_env_cache()
+    brainstorm.reset_env_cache()
@@ -0,0 +1,39 @@
+from domainidom.analyze import score_candidates
+from domainidom.models import DomainCheckResult
+
+
+def test_score_candidates_sorted_with_details():
+    research = {
+        "Memora": [
+            ("memora.com", DomainCheckResult("memora.com", True)),
+            ("memora.io", DomainCheckResult("memora.io", False)),
+        ],
+        "Xqzvbrtkl": [("xqzvbrtkl.com", DomainCheckResult("xqzvbrtkl.com", False))],
+    }
+    scored = score_candidates(["Xqzvbrtkl", "Memora", "Nodomains"], research)
+
+    assert [c.name for c in scored][0] == "Memora"
+    assert scored == sorted(scored, key=lambda c: c.score, reverse=True)
+    memora = scored[0]
+    assert memora.details["availability"] == 0.5
+    assert [d.domain for d in memora.domains] == ["memora.com", "memora.io"]
+    nodomains = next(c for c in scored if c.name == "Nodomains")
+    assert nodomains.details["availability"] == 0.0
+    assert nodomains.domains == []
+
+
+def test_score_candidates_top_k_matches_full_ranking():
+    names = ["Memora", "Xqzvbrtkl", "Nexora", "Aeiouaeiou", "Brandora"]
+    full = score_candidates(names, {})
+    assert score_candidates(names, {}, top_k=2) == full[:2]
+    assert score_candidates(names, {}, top_k=0) == []
+
+
+def test_score_candidates_min_availability_drops_unavailable():
+    research = {
+        "Memora": [("memora.com", DomainCheckResult("memora.com", True))],
+        "Nexora": [("nexora.com", DomainCheckResult("nexora.com", False))],
+    }
+    scored = score_candidates(["Nexora", "Memora", "Zenvia"], research, min_availability=0.01)
+    assert [c.name for c in scored] == ["Memora"]
+    assert scored[0] == score_candidates(["Memora"], research)[0]
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+from domainidom import brainstorm
+
+
+def _llm_response(content):
+    resp = Mock()
+    resp.raise_for_status.return_value = None
+    resp.content = json.dumps({"choices": [{"message": {"content": content}}]}).encode()
+    return resp
+
+
+def test_llm_settings_cached_until_reset(monkeypatch):
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://first.test/v1")
+    brainstorm.reset_env_cache()
+    assert brainstorm._get_llm_base_url() == "http://first.test/v1"
+
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://second.test/v1")
+    assert brainstorm._get_llm_base_url() == "http://first.test/v1"
+
+    brainstorm.reset_env_cache()
+    assert brainstorm._get_llm_base_url() == "http://second.test/v1"
+    brainstorm.reset_env_cache()
+
+
+def test_clean_name_strips_list_and_fence_artifacts():
+    assert brainstorm._clean_name("```json") == ""
+    assert brainstorm._clean_name("  1. Nexora") == "Nexora"
+    assert brainstorm._clean_name('"Memora",') == "Memora"
+    assert brainstorm._clean_name("]") == ""
+
+
+def test_brainstorm_names_reuses_shared_client():
+    client = Mock()
+    client.post.return_value = _llm_response('["Nexora", "nexora", "Memora"]')
+    with patch.object(brainstorm, "_get_client", return_value=client):
+        assert brainstorm.brainstorm_names("idea") == ["Nexora", "Memora"]
+        brainstorm.brainstorm_names("idea")
+    assert client.post.call_count == 2
+
+
+def test_llm_cache_reused_until_env_reset(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "a.sqlite3"))
+    first = brainstorm._llm_cache()
+    assert brainstorm._llm_cache() is first
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "b.sqlite3"))
+    brainstorm.reset_env_cache()
+    assert brainstorm._llm_cache().path == tmp_path / "b.sqlite3"
+
+
+def test_brainstorm_names_falls_back_without_llm():
+    client = Mock()
+    client.post.side_effect = OSError("connection refused")
+    with patch.object(brainstorm, "_get_client", return_value=client):
+        names = brainstorm.brainstorm_names("idea", max_candidates=3)
+    assert names == ["Nexora", "Brandora", "Aivanta"]
+
+
+def test_brainstorm_names_parses_fenced_json_array():
+    client = Mock()
+    client.post.return_value = _llm_response('```json\n["Lumico", "Novara"]\n```')
+    with patch.object(brainstorm, "_get_client", return_value=client):
+        assert brainstorm.brainstorm_names("idea") == ["Lumico", "Novara"]
+
+
+def test_brainstorm_names_async_matches_sync_parsing():
+    with patch("httpx.AsyncClient") as mock_client:
+        post = mock_client.return_value.__aenter__.return_value.post
+        post.return_value = _llm_response('["Nexora", "NEXORA", "Zenvia"]')
+        names = asyncio.run(brainstorm.brainstorm_names_async("idea"))
+    assert names == ["Nexora", "Zenvia"]
+    post.assert_awaited_once()
+
+
+def test_brainstorm_names_async_reuses_given_client():
+    client = Mock()
+    client.post = AsyncMock(return_value=_llm_response('["Lumico"]'))
+    with patch("httpx.AsyncClient") as mock_client:
+        for _ in range(2):
+            assert asyncio.run(brainstorm.brainstorm_names_async("idea", client=client)) == [
+                "Lumico"
+            ]
+    mock_client.assert_not_called()
+    assert client.post.await_count == 2
+
+
+def test_llm_cache_skips_network_on_repeat(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "1")
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm.sqlite3"))
+    client = Mock()
+    client.post.return_value = _llm_response('["Verveo", "Briofy"]')
+    with patch.object(brainstorm, "_get_client", return_value=client):
+        assert brainstorm.brainstorm_names("idea") == ["Verveo", "Briofy"]
+        assert brainstorm.brainstorm_names("idea", max_candidates=1) == ["Verveo"]
+        brainstorm.brainstorm_names("another idea")
+    assert client.post.call_count == 2
+
+
+def test_empty_idea_skips_llm():
+    client = Mock()
+    with patch.object(brainstorm, "_get_client", return_value=client):
+        assert brainstorm.brainstorm_names("  \n", max_candidates=2) == ["Nexora", "Brandora"]
+    client.post.assert_not_called()
@@ -0,0 +1,41 @@
+import os
+
+from domainidom import config
+
+
+def test_load_env_applies_dotenv_once(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("DOMAINIDOM_TEST_A=one\n")
+    monkeypatch.delenv("DOTENV_SKIP", raising=False)
+    monkeypatch.delenv("ENV_LOADED", raising=False)
+    monkeypatch.delenv("DOMAINIDOM_TEST_A", raising=False)
+    monkeypatch.delenv("DOMAINIDOM_TEST_B", raising=False)
+    monkeypatch.setattr(config, "find_dotenv", lambda: str(env_file))
+
+    config.load_env()
+    assert os.environ["DOMAINIDOM_TEST_A"] == "one"
+    assert os.environ["ENV_LOADED"] == "1"
+
+    # Edits after the first load are not picked up within the same process
+    env_file.write_text("DOMAINIDOM_TEST_A=two\nDOMAINIDOM_TEST_B=three\n")
+    config.load_env()
+    assert os.environ["DOMAINIDOM_TEST_A"] == "one"
+    assert "DOMAINIDOM_TEST_B" not in os.environ
+
+
+def test_load_env_keeps_existing_variables(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("DOMAINIDOM_TEST_A=from-file\n")
+    monkeypatch.delenv("DOTENV_SKIP", raising=False)
+    monkeypatch.delenv("ENV_LOADED", raising=False)
+    monkeypatch.setenv("DOMAINIDOM_TEST_A", "from-env")
+    monkeypatch.setattr(config, "find_dotenv", lambda: str(env_file))
+
+    config.load_env()
+    assert os.environ["DOMAINIDOM_TEST_A"] == "from-env"
+
+
+def test_load_env_skipped_via_env(monkeypatch):
+    monkeypatch.setenv("DOTENV_SKIP", "1")
+    monkeypatch.setattr(config, "find_dotenv", lambda: (_ for _ in ()).throw(AssertionError))
+    config.load_env()
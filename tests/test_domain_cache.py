@@ -1,3 +1,11 @@
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
 from domainidom.storage.cache import DomainCache
 
 
@@ -11,3 +19,184 @@ def test_cache_roundtrip(tmp_path):
     assert got[0] is True
     assert got[1] == 12.34
     assert got[2] == "stub"
+
+
+def test_cache_set_many(tmp_path):
+    cache = DomainCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("a.com", (None, None, "stub", "old"))
+    cache.set_many([("a.com", (False, None, "name.com", None)), ("b.io", (True, 9.5, "x", None))])
+    assert cache.get("a.com") == (False, None, "name.com", None)
+    assert cache.get("b.io") == (True, 9.5, "x", None)
+    cache.set_many([])
+
+
+def test_cache_get_many_chunks_large_lookups(tmp_path):
+    cache = DomainCache(str(tmp_path / "cache.sqlite3"))
+    cache.set_many([(f"n{i}.com", (i % 2 == 0, None, "stub", None)) for i in range(2000)])
+    wanted = [f"n{i}.com" for i in range(0, 2000, 2)] + ["missing.com"] * 1500
+    got = cache.get_many(wanted)
+    assert len(got) == 1000
+    assert got["n0.com"] == (True, None, "stub", None)
+    assert "missing.com" not in got
+
+
+def test_cache_instances_share_writes(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    writer, reader = DomainCache(path), DomainCache(path)
+    assert reader.get("shared.com") is None
+    writer.set_many([("shared.com", (True, None, "stub", None))])
+    assert reader.get("shared.com") == (True, None, "stub", None)
+    assert reader._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    writer.close()
+    reader.close()
+
+
+def test_cache_serves_hot_domains_from_memory(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    DomainCache(str(path)).set_many([("hot.com", (True, 9.0, "stub", None))])
+    with sqlite3.connect(path) as conn:
+        conn.execute("DELETE FROM domain_cache")
+    cache = DomainCache(str(path))
+    assert cache.get("hot.com") == (True, 9.0, "stub", None)
+    assert cache.get_many(["hot.com", "cold.com"]) == {"hot.com": (True, 9.0, "stub", None)}
+
+
+def test_cache_expires_errors_but_keeps_results(tmp_path):
+    cache = DomainCache(str(tmp_path / "cache.sqlite3"), error_ttl_seconds=300)
+    cache.set_many([("ok.com", (True, None, "stub", None)), ("bad.com", (None, None, "x", "boom"))])
+    assert set(cache.get_many(["ok.com", "bad.com"])) == {"ok.com", "bad.com"}
+
+    later = time.time() + 301
+    with patch("domainidom.storage.cache.time.time", return_value=later):
+        assert cache.get("bad.com") is None
+        assert DomainCache(str(tmp_path / "cache.sqlite3")).get_many(["ok.com", "bad.com"]) == {
+            "ok.com": (True, None, "stub", None)
+        }
+
+
+def test_cache_rereads_expired_memoized_errors(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = DomainCache(str(path), error_ttl_seconds=300)
+    cache.set("flaky.com", (None, None, "x", "boom"))
+
+    # Another process records a success after the error was memoized here
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "UPDATE domain_cache SET available=1, provider='stub', error=NULL, ts=? "
+            "WHERE domain='flaky.com'",
+            (time.time() + 301,),
+        )
+    with patch("domainidom.storage.cache.time.time", return_value=time.time() + 301):
+        assert cache.get("flaky.com") == (True, None, "stub", None)
+
+
+def test_cache_migrates_untimestamped_table(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE domain_cache (domain TEXT PRIMARY KEY, available INTEGER, "
+            "price_usd REAL, provider TEXT, error TEXT)"
+        )
+        conn.execute("INSERT INTO domain_cache VALUES ('old.com', 1, NULL, 'stub', NULL)")
+        conn.execute("INSERT INTO domain_cache VALUES ('err.com', NULL, NULL, 'x', 'boom')")
+    cache = DomainCache(str(path))
+    assert cache.get_many(["old.com", "err.com"]) == {"old.com": (True, None, "stub", None)}
+    schema = cache._conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'domain_cache'"
+    ).fetchone()[0]
+    assert "WITHOUT ROWID" in schema
+    cache.close()
+    # Reopening a migrated cache leaves it as is
+    assert DomainCache(str(path)).get("old.com") == (True, None, "stub", None)
+
+
+def test_cache_bulk_commits_once_or_not_at_all(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache, other = DomainCache(path), DomainCache(path)
+    with cache.bulk():
+        cache.set("a.com", (True, None, "stub", None))
+        cache.set_many([("b.com", (False, None, "stub", None))])
+        assert other.get_many(["a.com", "b.com"]) == {}
+    assert set(other.get_many(["a.com", "b.com"])) == {"a.com", "b.com"}
+
+    with pytest.raises(RuntimeError):
+        with cache.bulk():
+            cache.set("c.com", (True, None, "stub", None))
+            raise RuntimeError("abort")
+    assert cache.get("c.com") is None
+    assert other.get("c.com") is None
+
+
+def test_cache_stores_registrar_quotes_until_ttl(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    # A cache from before quotes were stored: schema version 1, no registrar_prices table
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE domain_cache (domain TEXT PRIMARY KEY, available INTEGER, "
+            "price_usd REAL, provider TEXT, error TEXT, ts REAL) WITHOUT ROWID"
+        )
+        conn.execute("PRAGMA user_version=1")
+    cache = DomainCache(str(path), price_ttl_seconds=60)
+    quotes = [
+        ("namecom", 15.99, "USD", True, "https://name.com/x", 17.99, None, None),
+        ("godaddy", None, "USD", None, None, None, None, "timeout"),
+    ]
+    cache.set_prices_many([("a.com", quotes), ("b.com", quotes[:1])])
+    assert cache.get_prices_many(["a.com", "b.com", "c.com"]) == {
+        "a.com": quotes,
+        "b.com": quotes[:1],
+    }
+
+    # Writing a domain again replaces all of its quotes
+    cache.set_prices_many([("a.com", quotes[1:])])
+    assert cache.get_prices_many(["a.com"]) == {"a.com": quotes[1:]}
+
+    with patch("domainidom.storage.cache.time.time", return_value=time.time() + 61):
+        assert cache.get_prices_many(["a.com", "b.com", "c.com"]) == {
+            "a.com": None,
+            "b.com": None,
+        }
+
+
+def test_cache_handles_concurrent_writers(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    DomainCache(path).close()
+
+    def worker(n):
+        cache = DomainCache(path)
+        for i in range(25):
+            cache.set_many([(f"w{n}-{i}.com", (True, float(i), "stub", None))])
+            assert cache.get(f"w{n}-{i}.com") == (True, float(i), "stub", None)
+        cache.close()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(worker, range(4)))
+
+    cache = DomainCache(path)
+    assert len(cache.get_many(f"w{n}-{i}.com" for n in range(4) for i in range(25))) == 100
+
+
+def test_cache_recreates_removed_directory(tmp_path):
+    path = tmp_path / "sub" / "cache.sqlite3"
+    DomainCache(str(path)).close()
+    shutil.rmtree(path.parent)
+    cache = DomainCache(str(path))
+    cache.set("a.com", (True, None, "stub", None))
+    assert cache.get("a.com") == (True, None, "stub", None)
+
+
+def test_cache_memo_is_not_shared_between_in_memory_databases():
+    a, b = DomainCache(":memory:"), DomainCache(":memory:")
+    a.set("x.com", (True, 1.0, "stub", None))
+    assert a.get("x.com") == (True, 1.0, "stub", None)
+    assert b.get("x.com") is None
+
+
+def test_cache_recreated_file_drops_memoized_rows(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = DomainCache(str(path))
+    cache.set("old.com", (True, None, "stub", None))
+    cache.close()
+    for f in tmp_path.iterdir():
+        f.unlink()
+    assert DomainCache(str(path)).get("old.com") is None
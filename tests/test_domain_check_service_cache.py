@@ -1,5 +1,15 @@
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from domainidom.models import PriceComparison, RegistrarPrice
 from domainidom.storage.cache import DomainCache
-from domainidom.services.domain_check import check_domains
+from domainidom.services import domain_check
+from domainidom.services.domain_check import ProviderResponse, check_domains
 
 
 def test_service_uses_cache(tmp_path, monkeypatch):
@@ -17,3 +27,327 @@ def test_service_uses_cache(tmp_path, monkeypatch):
     assert dcr.available is True
     assert dcr.provider == "stub"
     assert dcr.registrar_price_usd == 10.0
+
+
+def test_service_skips_event_loop_when_all_cached(tmp_path, monkeypatch):
+    db = tmp_path / "cache.sqlite3"
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(db))
+    DomainCache(str(db)).set_many(
+        [("a.com", (True, 9.0, "stub", None)), ("b.io", (False, None, "stub", None))]
+    )
+    background_loop = Mock()
+    monkeypatch.setattr(domain_check, "_background_loop", background_loop)
+
+    results = check_domains({"a": ["a.com", "b.io"], "b": ["b.io"]})
+    background_loop.assert_not_called()
+    assert [(d, r.available) for d, r in results["a"]] == [("a.com", True), ("b.io", False)]
+    assert results["b"][0][1].registrar_price_usd is None
+
+
+def test_service_bounds_concurrency_and_keeps_order(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("DOMAIN_CHECK_CONCURRENCY", "2")
+    in_flight = peak = 0
+
+    async def fake_fetch_best(domain, client=None, namecom=None, price_comparison=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later domains finish first
+        await asyncio.sleep(0.01 * (5 - int(domain[1])))
+        in_flight -= 1
+        return ProviderResponse(True, None, "fake")
+
+    monkeypatch.setattr(domain_check, "_fetch_best", fake_fetch_best)
+    domains = [f"d{i}.com" for i in range(5)]
+    results = check_domains({"d": domains})
+
+    assert peak == 2
+    assert [d for d, _ in results["d"]] == domains
+    assert DomainCache(str(tmp_path / "cache.sqlite3")).get("d4.com")[2] == "fake"
+
+
+def test_service_shares_one_client_and_batches_namecom(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("ENABLE_MULTI_REGISTRAR", "0")
+    monkeypatch.setenv("NAME_COM_USERNAME", "user")
+    monkeypatch.setenv("NAME_COM_API_KEY", "token")
+    resp = Mock()
+    resp.raise_for_status.return_value = None
+    resp.content = json.dumps(
+        {
+            "results": [
+                {"domainName": "c.com", "purchasable": False},
+                {"domainName": "a.com", "purchasable": True},
+                {"domainName": "b.com", "purchasable": True},
+            ]
+        }
+    ).encode()
+
+    with patch("httpx.AsyncClient") as mock_client:
+        mock_client.return_value.__aenter__.return_value.post.return_value = resp
+        results = check_domains({"n": ["a.com", "b.com", "c.com"]})
+
+    post = mock_client.return_value.__aenter__.return_value.post
+    assert mock_client.call_count == 1
+    # Name.com accepts many domains per request: one batched POST for the whole run
+    assert post.await_count == 1
+    assert json.loads(post.call_args.kwargs["content"]) == {
+        "domainNames": ["a.com", "b.com", "c.com"]
+    }
+    assert [dcr.provider for _d, dcr in results["n"]] == ["name.com"] * 3
+    assert [dcr.available for _d, dcr in results["n"]] == [True, True, False]
+
+
+def test_service_fetches_shared_domains_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("DOMAIN_CHECK_MAX_CALLS", "2")
+    fetched = []
+
+    async def fake_fetch_best(domain, client=None, namecom=None, price_comparison=None):
+        fetched.append(domain)
+        return ProviderResponse(True, None, "fake")
+
+    monkeypatch.setattr(domain_check, "_fetch_best", fake_fetch_best)
+    results = check_domains({"a": ["x.com", "y.com"], "b": ["x.com", "y.com", "z.com"]})
+
+    assert sorted(fetched) == ["x.com", "y.com"]
+    assert [d for d, _ in results["b"]] == ["z.com", "x.com", "y.com"]
+    assert results["a"][0][1] is results["b"][1][1]
+    assert results["b"][0][1].error == "max_calls_reached"
+
+
+def test_service_reuses_one_event_loop_across_calls(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    loops = []
+
+    async def fake_fetch_best(domain, client=None, namecom=None, price_comparison=None):
+        loops.append(asyncio.get_running_loop())
+        return ProviderResponse(True, None, "fake")
+
+    monkeypatch.setattr(domain_check, "_fetch_best", fake_fetch_best)
+    check_domains({"a": ["one.com"]})
+    check_domains({"b": ["two.com"]})
+    assert len(loops) == 2 and loops[0] is loops[1]
+
+
+def test_token_bucket_spaces_out_acquires_after_burst():
+    bucket = domain_check.TokenBucket(rps=50, burst=1)
+
+    async def acquire_all():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        return time.monotonic() - start
+
+    # One token from the burst, then three more at 20ms intervals
+    assert 0.055 <= asyncio.run(acquire_all()) < 0.2
+
+
+def test_token_bucket_paces_callers_on_separate_loops():
+    bucket = domain_check.TokenBucket(rps=20, burst=1)
+    start = time.monotonic()
+    times = []
+    times_lock = threading.Lock()
+
+    def run_loop():
+        async def acquire_three():
+            for _ in range(3):
+                await bucket.acquire()
+                with times_lock:
+                    times.append(time.monotonic() - start)
+
+        asyncio.run(acquire_three())
+
+    threads = [threading.Thread(target=run_loop) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # Six acquires across two threads still come one per 50ms, not two at a time
+    times.sort()
+    assert all(b - a >= 0.04 for a, b in zip(times, times[1:]))
+    assert times[-1] >= 0.24
+
+
+def test_service_callable_from_running_event_loop(tmp_path, monkeypatch):
+    db = tmp_path / "cache.sqlite3"
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(db))
+    DomainCache(str(db)).set("example.com", (True, 10.0, "stub", None))
+
+    async def inside_loop():
+        via_sync = check_domains({"ex": ["example.com"]})
+        via_async = await domain_check.acheck_domains({"ex": ["example.com"]})
+        return via_sync, via_async
+
+    via_sync, via_async = asyncio.run(inside_loop())
+    assert via_sync["ex"][0][1].available is True
+    assert via_async["ex"][0][1] == via_sync["ex"][0][1]
+
+
+def test_fetch_best_takes_first_definitive_provider(monkeypatch):
+    monkeypatch.delenv("MCP_FASTDOMAINCHECK_ENABLED", raising=False)
+    monkeypatch.setenv("ENABLE_MULTI_REGISTRAR", "0")
+    cancelled = []
+
+    async def slow_namecom(domain, client=None):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(domain)
+            raise
+        return ProviderResponse(True, None, "name.com")
+
+    async def fast_domainr(domain, client=None):
+        return ProviderResponse(False, None, "domainr")
+
+    with (
+        patch.object(domain_check, "_fetch_namecom", slow_namecom),
+        patch.object(domain_check, "_fetch_domainr", fast_domainr),
+    ):
+        start = time.monotonic()
+        res = asyncio.run(domain_check._fetch_best("slow.com"))
+    assert res.provider == "domainr"
+    assert time.monotonic() - start < 1
+    assert cancelled == ["slow.com"]
+
+
+def test_fetch_best_prefers_namecom_on_tie(monkeypatch):
+    monkeypatch.delenv("MCP_FASTDOMAINCHECK_ENABLED", raising=False)
+    monkeypatch.setenv("ENABLE_MULTI_REGISTRAR", "0")
+
+    async def namecom(domain, client=None):
+        return ProviderResponse(True, 12.0, "name.com")
+
+    async def domainr(domain, client=None):
+        return ProviderResponse(False, None, "domainr")
+
+    with (
+        patch.object(domain_check, "_fetch_namecom", namecom),
+        patch.object(domain_check, "_fetch_domainr", domainr),
+    ):
+        assert asyncio.run(domain_check._fetch_best("tie.com")).provider == "name.com"
+
+
+def test_service_checks_sequentially_at_concurrency_one(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("DOMAIN_CHECK_CONCURRENCY", "1")
+    tasks = []
+
+    async def fake_fetch_best(domain, client=None, namecom=None, price_comparison=None):
+        tasks.append(asyncio.current_task())
+        return ProviderResponse(True, None, "fake")
+
+    monkeypatch.setattr(domain_check, "_fetch_best", fake_fetch_best)
+    results = check_domains({"n": ["a.com", "b.com", "c.com"]})
+    assert [d for d, _ in results["n"]] == ["a.com", "b.com", "c.com"]
+    # All three ran inside the run's own task rather than one task each
+    assert len(set(tasks)) == 1
+
+
+def test_service_prices_all_domains_in_one_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setenv("ENABLE_MULTI_REGISTRAR", "1")
+    batches = []
+
+    async def fake_batch(domains, client=None):
+        batches.append(list(domains))
+        return {
+            d: PriceComparison(d, [RegistrarPrice("namecom", 9.0, "USD", d != "b.com")])
+            for d in domains
+        }
+
+    monkeypatch.setattr(domain_check, "get_multi_registrar_pricing_batch", fake_batch)
+    monkeypatch.setattr(
+        domain_check, "get_multi_registrar_pricing", Mock(side_effect=AssertionError)
+    )
+    results = check_domains({"n": ["a.com", "b.com", "c.com"]})
+
+    assert batches == [["a.com", "b.com", "c.com"]]
+    assert [dcr.available for _d, dcr in results["n"]] == [True, False, True]
+    assert results["n"][0][1].registrar_price_usd == 9.0
+
+
+def test_concurrent_runs_share_in_flight_lookups(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    fetched = []
+
+    async def fake_fetch_best(domain, client=None, namecom=None, price_comparison=None):
+        fetched.append(domain)
+        await asyncio.sleep(0.02)
+        return ProviderResponse(True, None, "fake")
+
+    monkeypatch.setattr(domain_check, "_fetch_best", fake_fetch_best)
+
+    async def both():
+        return await asyncio.gather(
+            domain_check.acheck_domains({"a": ["x.com", "y.com"]}),
+            domain_check.acheck_domains({"b": ["y.com", "z.com"]}),
+        )
+
+    first, second = asyncio.run(both())
+    assert sorted(fetched) == ["x.com", "y.com", "z.com"]
+    assert first["a"][1][1] is second["b"][0][1]
+    assert [d for d, _ in second["b"]] == ["y.com", "z.com"]
+
+
+def test_service_closes_cache_when_lookup_fails(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    opened = []
+    real_open = domain_check._open_cache
+
+    def tracking_open():
+        cache = real_open()
+        cache.close = Mock(wraps=cache.close)
+        opened.append(cache)
+        return cache
+
+    async def failing_check_each(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(domain_check, "_open_cache", tracking_open)
+    monkeypatch.setattr(domain_check, "_check_each", failing_check_each)
+    with pytest.raises(RuntimeError):
+        asyncio.run(domain_check.acheck_domains({"a": ["x.com"]}))
+    assert opened and all(c.close.called for c in opened)
+
+
+def test_provider_hosts_follow_enabled_registrars(monkeypatch):
+    monkeypatch.setenv("ENABLE_MULTI_REGISTRAR", "1")
+    monkeypatch.setenv("ENABLE_NAMECHEAP", "0")
+    monkeypatch.delenv("MCP_FASTDOMAINCHECK_ENABLED", raising=False)
+    hosts = domain_check._provider_hosts()
+    assert "api.godaddy.com" in hosts
+    assert "api.domainr.com" in hosts
+    assert "api.namecheap.com" not in hosts
+
+    monkeypatch.setenv("ENABLE_MULTI_REGISTRAR", "0")
+    assert "api.godaddy.com" not in domain_check._provider_hosts()
+
+
+def test_joined_lookup_retried_when_owner_is_cancelled(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOMAIN_CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+    calls = []
+
+    async def fake_fetch_best(domain, client=None, namecom=None, price_comparison=None):
+        calls.append(domain)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return ProviderResponse(True, None, "fake")
+
+    monkeypatch.setattr(domain_check, "_fetch_best", fake_fetch_best)
+
+    async def main():
+        owner = asyncio.create_task(domain_check.acheck_domains({"a": ["x.com"]}))
+        await asyncio.sleep(0.05)
+        joiner = asyncio.create_task(domain_check.acheck_domains({"b": ["x.com"]}))
+        await asyncio.sleep(0.05)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await joiner
+
+    results = asyncio.run(main())
+    assert calls == ["x.com", "x.com"]
+    assert results["b"][0][1].available is True
+    assert DomainCache(str(tmp_path / "cache.sqlite3")).get("x.com")[3] is None
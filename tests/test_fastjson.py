@@ -0,0 +1,31 @@
+import json
+
+from domainidom.models import DomainCheckResult, PriceComparison, RegistrarPrice
+from domainidom.utils import fastjson
+
+
+def test_dumps_roundtrip_with_dataclasses():
+    payload = {"names": ["Memora"], "price": RegistrarPrice("namecom", 12.99, "USD", True)}
+    data = fastjson.loads(fastjson.dumps(payload, indent=True))
+    assert data["names"] == ["Memora"]
+    assert data["price"]["registrar"] == "namecom"
+    assert data["price"]["price_usd"] == 12.99
+
+
+def test_stdlib_fallback_matches(monkeypatch):
+    payload = {"names": ["Memora", "Café"], "price": RegistrarPrice("godaddy", 9.5)}
+    fast = fastjson.dumps(payload)
+    monkeypatch.setattr(fastjson, "ORJSON_AVAILABLE", False)
+    slow = fastjson.dumps(payload)
+    assert json.loads(fast) == json.loads(slow)
+    assert fastjson.loads(slow) == json.loads(slow)
+    assert fastjson.dumps(payload, indent=True).decode("utf-8").startswith('{\n  "names"')
+
+
+def test_stdlib_fallback_serializes_nested_dataclasses(monkeypatch):
+    monkeypatch.setattr(fastjson, "ORJSON_AVAILABLE", False)
+    comparison = PriceComparison("memora.com", [RegistrarPrice("namecom", 12.99, "USD", True)])
+    dcr = DomainCheckResult("memora.com", True, 12.99, "namecom", None, comparison)
+    data = fastjson.loads(fastjson.dumps(dcr))
+    assert data["price_comparison"]["best_price"]["registrar"] == "namecom"
+    assert data["price_comparison"]["prices"][0]["price_usd"] == 12.99
@@ -123,3 +123,26 @@ def test_check_domains_cached_results_with_mcp(tmp_path, monkeypatch):
 
     assert uncached_result is not None
     # Uncached should have been processed by MCP or fallback provider
+
+
+def test_mcp_batch_request_and_response_roundtrip(monkeypatch):
+    """Test the MCP batch body is JSON-encoded and the response parsed from bytes."""
+    import asyncio
+    import json
+    from unittest.mock import AsyncMock, Mock
+
+    from domainidom.services.domain_check import MCPFastDomainCheckClient
+
+    monkeypatch.setenv("MCP_FASTDOMAINCHECK_API_KEY", "test-key")
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.content = b'{"results": [{"domain": "a.com", "available": true, "price_usd": 9.5}]}'
+    client = Mock()
+    client.post = AsyncMock(return_value=response)
+
+    batch = asyncio.run(MCPFastDomainCheckClient().check_domains_batch(["a.com"], client=client))
+
+    assert batch.results[0].available is True
+    assert batch.results[0].price_usd == 9.5
+    sent = json.loads(client.post.call_args.kwargs["content"])
+    assert sent == {"domains": ["a.com"], "include_pricing": True}
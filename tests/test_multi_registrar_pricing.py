@@ -1,16 +1,35 @@
 """Tests for multi-registrar pricing system."""
 
+import asyncio
+import json
 import pytest
 import time
 from unittest.mock import AsyncMock, patch, Mock
 from domainidom.models import RegistrarPrice, PriceComparison
 from domainidom.services.pricing import (
     get_namecom_price,
+    get_namecom_prices,
     get_godaddy_price,
+    get_godaddy_prices,
     get_cloudflare_price,
     get_namecheap_price,
+    get_namecheap_prices,
     get_multi_registrar_pricing,
+    get_multi_registrar_pricing_batch,
+    reset_env_cache,
 )
+from domainidom.services import pricing
+
+
+def test_credentials_cached_until_reset(monkeypatch):
+    monkeypatch.setenv("GODADDY_API_KEY", "first")
+    assert pricing._get_godaddy_credentials()[0] == "first"
+
+    monkeypatch.setenv("GODADDY_API_KEY", "second")
+    assert pricing._get_godaddy_credentials()[0] == "first"
+
+    reset_env_cache()
+    assert pricing._get_godaddy_credentials()[0] == "second"
 
 
 class TestRegistrarPrice:
@@ -75,15 +94,17 @@ class TestNamecomPricing:
 
         # Mock HTTP response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "results": [
-                {
-                    "purchasable": True,
-                    "purchasePrice": {"amount": "12.99"},
-                    "renewalPrice": {"amount": "15.99"},
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "results": [
+                    {
+                        "purchasable": True,
+                        "purchasePrice": {"amount": "12.99"},
+                        "renewalPrice": {"amount": "15.99"},
+                    }
+                ]
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
 
         with patch("httpx.AsyncClient") as mock_client:
@@ -104,6 +125,35 @@ class TestNamecomPricing:
                 assert result.is_available is True
                 assert "name.com" in result.registration_url
 
+    @pytest.mark.asyncio
+    async def test_namecom_prices_batches_domains(self, monkeypatch):
+        monkeypatch.setenv("NAME_COM_USERNAME", "test_user")
+        monkeypatch.setenv("NAME_COM_API_KEY", "test_key")
+
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "results": [
+                    {"domainName": "b.com", "purchasable": False},
+                    {"domainName": "a.com", "purchasable": True, "purchasePrice": {"amount": 9.5}},
+                ]
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        client = Mock()
+        client.post = AsyncMock(return_value=mock_response)
+
+        with patch("domainidom.services.pricing.rate_limiters") as mock_limiters:
+            mock_limiters.__getitem__.return_value = AsyncMock()
+            results = await get_namecom_prices(["a.com", "B.com", "c.com"], client=client)
+
+        client.post.assert_awaited_once()
+        sent = json.loads(client.post.call_args.kwargs["content"])
+        assert sent == {"domainNames": ["a.com", "B.com", "c.com"]}
+        assert results["a.com"].price_usd == 9.5
+        assert results["B.com"].is_available is False
+        assert results["c.com"].error == "missing_result"
+
     @pytest.mark.asyncio
     async def test_namecom_price_missing_credentials(self, monkeypatch):
         monkeypatch.delenv("NAME_COM_USERNAME", raising=False)
@@ -139,7 +189,9 @@ class TestGodaddyPricing:
         monkeypatch.setenv("ENABLE_GODADDY", "1")
 
         mock_response = Mock()
-        mock_response.json.return_value = {"available": True, "price": 1299000}  # Price in micros
+        mock_response.content = json.dumps(
+            {"available": True, "price": 1299000}
+        ).encode()  # Price in micros
         mock_response.raise_for_status.return_value = None
 
         with patch("httpx.AsyncClient") as mock_client:
@@ -168,6 +220,64 @@ class TestGodaddyPricing:
         assert result.price_usd is None
         assert result.error == "missing_credentials_or_disabled"
 
+    @pytest.mark.asyncio
+    async def test_godaddy_requests_capped_in_flight(self, monkeypatch):
+        monkeypatch.setenv("GODADDY_API_KEY", "test_key")
+        monkeypatch.setenv("GODADDY_API_SECRET", "test_secret")
+        monkeypatch.setitem(pricing.REGISTRAR_MAX_INFLIGHT, "godaddy", 2)
+        in_flight = peak = 0
+
+        async def fake_get(url, headers=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            resp = Mock()
+            resp.content = b'{"available": false}'
+            return resp
+
+        client = Mock()
+        client.get = fake_get
+        with patch("domainidom.services.pricing.rate_limiters") as mock_limiters:
+            mock_limiters.__getitem__.return_value = AsyncMock()
+            results = await asyncio.gather(
+                *(get_godaddy_price(f"d{i}.com", client=client) for i in range(6))
+            )
+
+        assert [r.is_available for r in results] == [False] * 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_godaddy_prices_uses_bulk_endpoint(self, monkeypatch):
+        monkeypatch.setenv("GODADDY_API_KEY", "test_key")
+        monkeypatch.setenv("GODADDY_API_SECRET", "test_secret")
+
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {
+                "domains": [
+                    {"domain": "a.com", "available": True, "price": 11990000},
+                    {"domain": "b.com", "available": False},
+                ],
+                "errors": [{"domain": "c.bad", "code": "UNSUPPORTED_TLD"}],
+            }
+        ).encode()
+        mock_response.raise_for_status.return_value = None
+        client = Mock()
+        client.post = AsyncMock(return_value=mock_response)
+
+        with patch("domainidom.services.pricing.rate_limiters") as mock_limiters:
+            mock_limiters.__getitem__.return_value = AsyncMock()
+            results = await get_godaddy_prices(["a.com", "b.com", "c.bad"], client=client)
+
+        client.post.assert_awaited_once()
+        assert json.loads(client.post.call_args.kwargs["content"]) == ["a.com", "b.com", "c.bad"]
+        assert results["a.com"].price_usd == 11.99
+        assert results["a.com"].is_available is True
+        assert results["b.com"].is_available is False
+        assert results["c.bad"].error == "UNSUPPORTED_TLD"
+
 
 class TestCloudflareAndNamecheap:
     @pytest.mark.asyncio
@@ -192,7 +302,13 @@ class TestCloudflareAndNamecheap:
         monkeypatch.setenv("ENABLE_NAMECHEAP", "1")
 
         mock_response = Mock()
-        mock_response.text = '<xml><result Available="true" Domain="example.com"/></xml>'
+        mock_response.content = (
+            b'<?xml version="1.0" encoding="utf-8"?>'
+            b'<ApiResponse Status="OK" xmlns="http://api.namecheap.com/xml.response">'
+            b'<CommandResponse Type="namecheap.domains.check">'
+            b'<DomainCheckResult Domain="example.com" Available="true" />'
+            b"</CommandResponse></ApiResponse>"
+        )
         mock_response.raise_for_status.return_value = None
 
         with patch("httpx.AsyncClient") as mock_client:
@@ -210,6 +326,35 @@ class TestCloudflareAndNamecheap:
                 assert result.is_available is True
                 assert "pricing_requires_separate_api_call" in result.error
 
+    @pytest.mark.asyncio
+    async def test_namecheap_prices_batches_domains(self, monkeypatch):
+        monkeypatch.setenv("NAMECHEAP_API_USER", "test_user")
+        monkeypatch.setenv("NAMECHEAP_API_KEY", "test_key")
+        monkeypatch.setenv("ENABLE_NAMECHEAP", "1")
+
+        mock_response = Mock()
+        mock_response.content = (
+            b'<ApiResponse Status="OK" xmlns="http://api.namecheap.com/xml.response">'
+            b"<CommandResponse>"
+            b'<DomainCheckResult Domain="a.com" Available="true" />'
+            b'<DomainCheckResult Domain="b.com" Available="false" />'
+            b"</CommandResponse></ApiResponse>"
+        )
+        mock_response.raise_for_status.return_value = None
+        client = Mock()
+        client.get = AsyncMock(return_value=mock_response)
+
+        with patch("domainidom.services.pricing.rate_limiters") as mock_limiters:
+            mock_limiters.__getitem__.return_value = AsyncMock()
+            results = await get_namecheap_prices(["a.com", "B.com", "c.com"], client=client)
+
+        client.get.assert_awaited_once()
+        assert client.get.call_args.kwargs["params"]["DomainList"] == "a.com,B.com,c.com"
+        assert results["a.com"].is_available is True
+        assert results["B.com"].is_available is False
+        assert results["c.com"].is_available is None
+        assert results["c.com"].error == "missing_result"
+
 
 class TestMultiRegistrarPricing:
     @pytest.mark.asyncio
@@ -242,10 +387,68 @@ class TestMultiRegistrarPricing:
             assert result.best_price.price_usd == 12.99
 
             # Verify all functions were called
-            mock_namecom.assert_called_once_with("example.com")
-            mock_godaddy.assert_called_once_with("example.com")
-            mock_cloudflare.assert_called_once_with("example.com")
-            mock_namecheap.assert_called_once_with("example.com")
+            mock_namecom.assert_called_once_with("example.com", client=None)
+            mock_godaddy.assert_called_once_with("example.com", client=None)
+            mock_cloudflare.assert_called_once_with("example.com", client=None)
+            mock_namecheap.assert_called_once_with("example.com", client=None)
+
+    @pytest.mark.asyncio
+    async def test_multi_registrar_pricing_is_parallel(self, monkeypatch):
+        for name in ("NAMECOM", "GODADDY", "CLOUDFLARE", "NAMECHEAP"):
+            monkeypatch.setenv(f"ENABLE_{name}", "1")
+
+        def slow(registrar):
+            async def fetch(domain, client=None):
+                await asyncio.sleep(0.2)
+                if registrar == "namecheap":
+                    raise RuntimeError("timeout")
+                return RegistrarPrice(registrar, 10.0, "USD", True)
+
+            return fetch
+
+        with (
+            patch("domainidom.services.pricing.get_namecom_price", slow("namecom")),
+            patch("domainidom.services.pricing.get_godaddy_price", slow("godaddy")),
+            patch("domainidom.services.pricing.get_cloudflare_price", slow("cloudflare")),
+            patch("domainidom.services.pricing.get_namecheap_price", slow("namecheap")),
+        ):
+            start = time.monotonic()
+            result = await get_multi_registrar_pricing("example.com")
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.4
+        assert [p.registrar for p in result.prices] == [
+            "namecom",
+            "godaddy",
+            "cloudflare",
+            "namecheap",
+        ]
+        assert result.prices[-1].error == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_multi_registrar_pricing_batch_calls_each_registrar_once(self, monkeypatch):
+        monkeypatch.setenv("ENABLE_CLOUDFLARE", "0")
+        monkeypatch.setenv("ENABLE_NAMECHEAP", "0")
+        domains = ["a.com", "b.com"]
+
+        namecom = AsyncMock(
+            return_value={
+                "a.com": RegistrarPrice("namecom", 15.99, "USD", True),
+                "b.com": RegistrarPrice("namecom", None, "USD", False),
+            }
+        )
+        godaddy = AsyncMock(side_effect=Exception("API Error"))
+        with (
+            patch("domainidom.services.pricing.get_namecom_prices", namecom),
+            patch("domainidom.services.pricing.get_godaddy_prices", godaddy),
+        ):
+            results = await get_multi_registrar_pricing_batch(domains)
+
+        namecom.assert_awaited_once_with(domains, client=None)
+        godaddy.assert_awaited_once_with(domains, client=None)
+        assert results["a.com"].best_price.registrar == "namecom"
+        assert results["b.com"].best_price is None
+        assert [p.error for p in results["b.com"].prices] == [None, "API Error"]
 
     @pytest.mark.asyncio
     async def test_multi_registrar_pricing_disabled(self, monkeypatch):
@@ -304,6 +507,22 @@ class TestRateLimiting:
         # Should take at least 0.5 seconds (1/2 RPS) for the third call
         assert (end_time - start_time) >= 0.4  # Allow some tolerance
 
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_concurrent_callers(self):
+        from domainidom.services.pricing import RateLimiter
+
+        limiter = RateLimiter(10.0)
+        done = []
+
+        async def call():
+            await limiter.acquire()
+            done.append(time.monotonic())
+
+        await asyncio.gather(*(call() for _ in range(3)))
+        done.sort()
+        assert done[1] - done[0] >= 0.09
+        assert done[2] - done[1] >= 0.09
+
     @pytest.mark.asyncio
     async def test_rate_limiter_zero_rps(self):
         from domainidom.services.pricing import RateLimiter
@@ -318,3 +537,18 @@ class TestRateLimiting:
 
         # Should be nearly instantaneous
         assert (end_time - start_time) < 0.1
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_burst(self):
+        from domainidom.services.pricing import RateLimiter
+
+        limiter = RateLimiter(10.0, burst=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        assert time.monotonic() - start < 0.05
+
+        # Bucket drained: the fourth call waits for one refill interval
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.09
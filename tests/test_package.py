@@ -0,0 +1,61 @@
+import csv
+import json
+
+from domainidom.models import DomainCheckResult, PriceComparison, RegistrarPrice, ScoredCandidate
+from domainidom.package import write_reports
+
+
+def test_write_reports_json(tmp_path):
+    comparison = PriceComparison("memora.com", [RegistrarPrice("namecom", 9.0, is_available=True)])
+    candidate = ScoredCandidate(
+        name="Memora",
+        score=0.9,
+        details={"length": 1.0},
+        domains=[DomainCheckResult("memora.com", True, 9.0, "name.com", None, comparison)],
+    )
+    out = tmp_path / "reports" / "report.json"
+    write_reports([candidate], out)
+
+    result = json.loads(out.read_text(encoding="utf-8"))["results"][0]
+    assert result["name"] == "Memora"
+    domain = result["domains"][0]
+    assert domain["price_usd"] == 9.0
+    assert domain["price_comparison"]["best_price"]["registrar"] == "namecom"
+
+
+def test_write_reports_json_streams_valid_document(tmp_path):
+    out = tmp_path / "report.json"
+    write_reports([], out)
+    assert json.loads(out.read_text(encoding="utf-8")) == {"results": []}
+
+    write_reports([ScoredCandidate("A", 0.2, {}, []), ScoredCandidate("B", 0.1, {}, [])], out)
+    assert [r["name"] for r in json.loads(out.read_bytes())["results"]] == ["A", "B"]
+
+
+def test_write_reports_csv_rows(tmp_path):
+    comparison = PriceComparison(
+        "memora.com",
+        [
+            RegistrarPrice("namecom", 9.0, is_available=True, registration_url="https://n"),
+            RegistrarPrice("godaddy", 12.0, is_available=True),
+        ],
+    )
+    scored = [
+        ScoredCandidate(
+            "Memora",
+            0.9,
+            {"length": 1.0, "balance": 0.5, "availability": 1.0},
+            [DomainCheckResult("memora.com", True, 9.0, "name.com", None, comparison)],
+        ),
+        ScoredCandidate("Nodomains", 0.1, {}, []),
+    ]
+    out = tmp_path / "report.csv"
+    write_reports(scored, out)
+
+    with out.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["name"] for r in rows] == ["Memora", "Nodomains"]
+    assert rows[0]["best_registrar"] == "namecom"
+    assert rows[0]["godaddy_price"] == "12.0"
+    assert rows[0]["registration_urls"] == "namecom:https://n"
+    assert rows[1]["domain"] == ""
@@ -1,4 +1,9 @@
-from domainidom.utils.phonetics import phonetic_similarity, vowel_consonant_balance
+from domainidom.utils.phonetics import (
+    phonetic_similarities,
+    phonetic_similarity,
+    vowel_consonant_balance,
+    vowel_consonant_balances,
+)
 
 
 def test_phonetic_similarity_basic():
@@ -7,3 +12,18 @@ def test_phonetic_similarity_basic():
 
 def test_vowel_consonant_balance():
     assert 0.0 <= vowel_consonant_balance("domain") <= 1.0
+
+
+def test_vowel_consonant_balances_matches_scalar():
+    names = ["domain", "Xqzvbrtkl", "", "Aeiou", "café-bar", "N3x0ra"]
+    assert vowel_consonant_balances(names) == [vowel_consonant_balance(n) for n in names]
+    assert vowel_consonant_balances(names[:2] + names[3:4]) == [
+        vowel_consonant_balance(n) for n in names[:2] + names[3:4]
+    ]
+
+
+def test_phonetic_similarities_matches_scalar():
+    others = ["Smyth", "Jones", "", "Schmidt"]
+    assert phonetic_similarities("Smith", others) == [
+        phonetic_similarity("Smith", b) for b in others
+    ]